@@ -1,7 +1,8 @@
 """Example usage of the Link Safety Checker with complete analysis."""
 import json
-from src.url_analyzer import analyze_url_complete
-from src.api_client import APIKeyError
+import logging
+from src.url_analyzer import analyze_url_complete, analyze_urls_concurrent
+from src.api_client import is_api_configured
 
 
 def print_detailed_verdict(verdict):
@@ -48,6 +49,8 @@ def print_json_verdict(verdict):
 
 def main():
     """Demonstrate complete URL safety analysis."""
+    logging.basicConfig(level=logging.INFO)
+
     # Example URLs with various risk profiles
     test_urls = [
         "https://google.com",  # Safe, well-known
@@ -60,25 +63,19 @@ def main():
     print("="*70)
     print("\nThis demo shows the new Risk Score and Analysis feature!")
     print("Combining Google Safe Browsing API with rule-based analysis.\n")
+
+    # Check the API key once up front instead of catching APIKeyError per URL
+    if not is_api_configured():
+        print("❌ No API key configured - using rule-based scoring only.")
+        print("Set GOOGLE_SAFE_BROWSING_API_KEY in .env to enable API checks.\n")
     
-    for url in test_urls:
-        try:
-            # Perform complete analysis
-            verdict = analyze_url_complete(url)
-            
-            # Display detailed results
-            print_detailed_verdict(verdict)
-            
-        except APIKeyError as e:
-            print(f"\n❌ API Key Error: {e}")
-            print(f"Note: Analysis will continue with rule-based scoring only.\n")
-            
-            # Still analyze with rules only
-            verdict = analyze_url_complete(url)
+    # Analyze all URLs concurrently instead of blocking on each network RTT
+    try:
+        verdicts = analyze_urls_concurrent(test_urls)
+        for verdict in verdicts:
             print_detailed_verdict(verdict)
-            
-        except Exception as e:
-            print(f"\n❌ Unexpected Error analyzing {url}: {e}\n")
+    except Exception as e:
+        print(f"\n❌ Unexpected Error during analysis: {e}\n")
     
     # Show JSON output example
     print("\n" + "="*70)
@@ -0,0 +1,5 @@
+"""Entry point for the Link Safety Checker GUI."""
+from src.gui import main
+
+if __name__ == "__main__":
+    main()
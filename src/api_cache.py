@@ -0,0 +1,99 @@
+"""Persistent verdict cache for Google Safe Browsing results."""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentVerdictCache:
+    """SQLite-backed TTL cache of per-URL Safe Browsing verdicts.
+
+    Unlike the in-memory cache in api_client, entries survive process
+    restarts, so repeat runs of the demo scripts or GUI skip the network
+    for recently checked URLs. All operations are best-effort: any
+    storage error degrades to a cache miss rather than failing the check.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Initialize the persistent cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+                (defaults to ~/.lsc_cache.db)
+        """
+        self.db_path = Path(db_path) if db_path else Path.home() / ".lsc_cache.db"
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily; one connection per process."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts ("
+                "url TEXT PRIMARY KEY, body BLOB, expires INTEGER)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Look up a non-expired cached verdict.
+
+        Args:
+            url: Canonical URL key
+
+        Returns:
+            Cached result dictionary, or None on miss/expiry/error
+        """
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT body FROM verdicts WHERE url=? AND expires>?",
+                    (url, int(time.time()))
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.debug("Persistent cache read failed: %s", e)
+            return None
+
+    def set(self, url: str, result: Dict[str, Any], ttl: float):
+        """Store a verdict with an expiry.
+
+        Args:
+            url: Canonical URL key
+            result: API-response-shaped result to store
+            ttl: Lifetime in seconds (honor the API's cacheDuration)
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO verdicts (url, body, expires) VALUES (?, ?, ?)",
+                    (url, json.dumps(result), int(time.time() + ttl))
+                )
+                conn.commit()
+        except Exception as e:
+            logger.debug("Persistent cache write failed: %s", e)
+
+    def clear(self):
+        """Remove all cached verdicts."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM verdicts")
+                conn.commit()
+        except Exception as e:
+            logger.debug("Persistent cache clear failed: %s", e)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
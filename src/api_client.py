@@ -1,7 +1,15 @@
 """Google Safe Browsing API client for URL safety checks."""
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
+from src.api_cache import PersistentVerdictCache
+from src.url_validator import normalize_url
 from src.config import (
     GOOGLE_SAFE_BROWSING_API_KEY,
     GOOGLE_SAFE_BROWSING_API_ENDPOINT,
@@ -10,13 +18,135 @@ from src.config import (
     THREAT_TYPES,
     PLATFORM_TYPES,
     THREAT_ENTRY_TYPES,
-    REQUEST_TIMEOUT
+    REQUEST_TIMEOUT,
+    REQUESTS_PER_MINUTE,
+    REQUEST_BURST
 )
 
-logging.basicConfig(level=logging.INFO)
+# Try to use orjson for faster JSON (de)serialization, fallback to stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# No basicConfig here: logging setup belongs to the application entry
+# point (example.py / gui.py), not a library import side effect
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """Create a shared HTTP session with connection pooling and retries.
+
+    Reusing one session keeps the HTTPS connection to the Safe Browsing
+    endpoint alive between checks, avoiding a TCP+TLS handshake per request.
+
+    Returns:
+        Configured requests.Session instance
+    """
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST"],
+        raise_on_status=False  # Keep status-code error mapping in check_url_safety
+    )
+    # requests is HTTP/1.1-only (no multiplexing), so concurrency comes
+    # from the connection pool instead: keep enough warm sockets for the
+    # concurrent analysis path, and batch URLs per request to cut round
+    # trips where HTTP/2 streams would otherwise help
+    session.mount("https://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=retry
+    ))
+    return session
+
+
+class _TokenBucket:
+    """Token-bucket limiter that paces API requests client-side.
+
+    Requests are held locally until a token is free, so bursts stay under
+    Google's per-minute quota instead of burning round trips on 429s.
+    """
+
+    def __init__(self, rate_per_min: float, burst: int):
+        """Initialize the bucket.
+
+        Args:
+            rate_per_min: Sustained request rate (tokens refilled per minute)
+            burst: Maximum tokens held (allowed burst size)
+        """
+        self.capacity = float(burst)
+        self.refill_rate = rate_per_min / 60.0  # tokens per second
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reset(self):
+        """Refill the bucket to capacity (mainly for tests)."""
+        with self.lock:
+            self.tokens = self.capacity
+            self.updated = time.monotonic()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.refill_rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_rate
+            time.sleep(wait)
+
+
+_session = _build_session()
+_bucket = _TokenBucket(REQUESTS_PER_MINUTE, REQUEST_BURST)
+
+
+def close_session():
+    """Close the shared HTTP session and its pooled connections.
+
+    Intended for application shutdown (e.g. GUI exit).
+    """
+    _session.close()
+
+
+def warm_connection():
+    """Open the HTTPS connection to the Safe Browsing host ahead of use.
+
+    A best-effort HEAD request pays the DNS lookup and TCP+TLS handshake
+    up front; the first real check then reuses the pooled connection
+    instead of adding a few hundred milliseconds of setup latency.
+    Failures are ignored - the scan path does its own error handling.
+    """
+    parts = urlsplit(GOOGLE_SAFE_BROWSING_API_ENDPOINT)
+    try:
+        _session.head(f"{parts.scheme}://{parts.netloc}/", timeout=3)
+    except requests.RequestException:
+        pass
+
+
+def is_api_configured() -> bool:
+    """Check whether a Safe Browsing API key is configured.
+
+    Lets callers take the rules-only branch directly instead of paying
+    for an APIKeyError raise/catch on every URL.
+
+    Returns:
+        True if an API key is configured, False otherwise
+    """
+    return bool(GOOGLE_SAFE_BROWSING_API_KEY)
+
+
 class SafeBrowsingAPIError(Exception):
     """Base exception for Safe Browsing API errors."""
     pass
@@ -37,16 +167,138 @@ class NetworkError(SafeBrowsingAPIError):
     pass
 
 
+class InvalidURLError(SafeBrowsingAPIError):
+    """Raised when a URL fails local validation before the API call."""
+    pass
+
+
+# Longest URL the API is asked about; anything bigger is rejected locally
+MAX_URL_LENGTH = 2048
+
+
+def _is_checkable_url(url: str) -> bool:
+    """Check locally whether a URL is worth sending to the API.
+
+    Obviously malformed inputs would only waste a network round trip on
+    a 400 response, so they are rejected before the request is built.
+
+    Args:
+        url: The URL to validate
+
+    Returns:
+        True if the URL looks sendable, False otherwise
+    """
+    if not url or len(url) > MAX_URL_LENGTH:
+        return False
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme in ("http", "https") and bool(parts.netloc)
+
+
+# Google caps the number of threat entries accepted per request
+MAX_ENTRIES_PER_REQUEST = 500
+
+# Immutable request-body skeleton; only threatEntries varies per call
+_BODY_TEMPLATE = {
+    "client": {
+        "clientId": CLIENT_ID,
+        "clientVersion": CLIENT_VERSION
+    },
+    "threatInfo": {
+        "threatTypes": THREAT_TYPES,
+        "platformTypes": PLATFORM_TYPES,
+        "threatEntryTypes": THREAT_ENTRY_TYPES
+    }
+}
+
+# In-process TTL cache of per-URL verdicts; a hit skips the HTTPS round trip
+CACHE_TTL = 300  # seconds, matches Google's typical cacheDuration
+CACHE_MAXSIZE = 10000
+_cache: Dict[str, Any] = {}  # url -> (expires_at, result)
+_cache_lock = threading.Lock()
+
+# Disk-backed second cache level: survives process restarts
+_persistent_cache = PersistentVerdictCache()
+
+
+def clear_cache():
+    """Clear the in-process and on-disk verdict caches (mainly for tests)."""
+    with _cache_lock:
+        _cache.clear()
+    _persistent_cache.clear()
+
+
+def _cache_ttl_for(result: Dict[str, Any]) -> float:
+    """Pick the cache TTL for a result, honoring the API's cacheDuration.
+
+    Args:
+        result: Per-URL API-response-shaped result
+
+    Returns:
+        TTL in seconds
+    """
+    for match in result.get("matches", []):
+        duration = match.get("cacheDuration", "")
+        if isinstance(duration, str) and duration.endswith("s"):
+            try:
+                return float(duration[:-1])
+            except ValueError:
+                pass
+    return CACHE_TTL
+
+
+def _cache_store(url: str, result: Dict[str, Any]):
+    """Store a successful result in the TTL cache."""
+    with _cache_lock:
+        if len(_cache) >= CACHE_MAXSIZE:
+            now = time.monotonic()
+            expired = [key for key, (expires_at, _) in _cache.items() if expires_at <= now]
+            for key in expired:
+                del _cache[key]
+            if len(_cache) >= CACHE_MAXSIZE:
+                _cache.pop(next(iter(_cache)))
+        _cache[url] = (time.monotonic() + _cache_ttl_for(result), result)
+
+
 def check_url_safety(url: str) -> Dict[str, Any]:
     """
     Check if a URL is safe using Google Safe Browsing API.
-    
+
     Args:
         url: The URL to check for safety
-        
+
     Returns:
         Dictionary containing the API response with threat information
-        
+
+    Raises:
+        InvalidURLError: When the URL fails local validation
+        APIKeyError: When API key is invalid or missing
+        RateLimitError: When rate limit is exceeded
+        NetworkError: When network connection fails
+        SafeBrowsingAPIError: For other API-related errors
+    """
+    result = check_urls_safety([url])[url]
+    if result.get("invalid_url"):
+        raise InvalidURLError(f"Not a checkable URL: {url!r}")
+    return result
+
+
+def check_urls_safety(urls: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Check multiple URLs in batched Safe Browsing API requests.
+
+    URLs are packed up to MAX_ENTRIES_PER_REQUEST per threatMatches:find
+    call, so N URLs cost ceil(N/500) round trips instead of N.
+
+    Args:
+        urls: List of URLs to check for safety
+
+    Returns:
+        Dictionary mapping each input URL to its API-response-shaped
+        result ({} when no threats matched, {"matches": [...]} otherwise)
+
     Raises:
         APIKeyError: When API key is invalid or missing
         RateLimitError: When rate limit is exceeded
@@ -56,48 +308,151 @@ def check_url_safety(url: str) -> Dict[str, Any]:
     if not GOOGLE_SAFE_BROWSING_API_KEY:
         logger.error("API key is not configured")
         raise APIKeyError("Google Safe Browsing API key is not configured. Please set GOOGLE_SAFE_BROWSING_API_KEY environment variable.")
-    
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    # Canonicalize so equivalent spellings share one cache entry and one
+    # threatEntry; track which inputs map to each canonical URL
+    canonical = {url: normalize_url(url) for url in urls}
+
+    # Serve cached verdicts first; only misses spend a network request
+    misses: Dict[str, List[str]] = {}
+    now = time.monotonic()
+    with _cache_lock:
+        for url in urls:
+            entry = _cache.get(canonical[url])
+            if entry and entry[0] > now:
+                results[url] = dict(entry[1])
+            else:
+                misses.setdefault(canonical[url], []).append(url)
+
+    # Second level: disk cache persisted across process restarts
+    for norm in list(misses):
+        stored = _persistent_cache.get(norm)
+        if stored is not None:
+            for url in misses.pop(norm):
+                results[url] = stored
+            with _cache_lock:
+                _cache[norm] = (now + _cache_ttl_for(stored), stored)
+
+    # Reject obviously-bad inputs locally instead of wasting a round trip
+    pending = []
+    for norm, originals in misses.items():
+        if _is_checkable_url(norm):
+            pending.append(norm)
+        else:
+            for url in originals:
+                results[url] = {"matches": [], "invalid_url": True}
+
+    chunks = [pending[start:start + MAX_ENTRIES_PER_REQUEST]
+              for start in range(0, len(pending), MAX_ENTRIES_PER_REQUEST)]
+
+    # Each chunk is one round trip; when a batch needs several, overlap
+    # them on a small pool instead of paying the latencies back to back.
+    # The session pool, caches and token bucket are all lock-protected
+    if len(chunks) <= 1:
+        chunk_result_sets = [_check_chunk(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+            chunk_result_sets = list(executor.map(_check_chunk, chunks))
+
+    # Cache successful results only; exceptions above skip this point
+    for chunk_results in chunk_result_sets:
+        for norm, result in chunk_results.items():
+            _cache_store(norm, result)
+            _persistent_cache.set(norm, result, _cache_ttl_for(result))
+            for url in misses[norm]:
+                results[url] = result
+
+    return results
+
+
+def _check_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Run one threatMatches:find request and demultiplex its matches.
+
+    Args:
+        chunk: Canonical URLs for this request (max 500)
+
+    Returns:
+        Dictionary mapping each canonical URL to its API-response-shaped
+        result
+    """
+    response = _post_threat_matches(chunk)
+
+    # Demultiplex matches back to canonical URLs by threat.threatEntry.url
+    chunk_results: Dict[str, Dict[str, Any]] = {norm: {} for norm in chunk}
+    for match in response.get("matches", []):
+        matched_url = match.get("threat", {}).get("url")
+        if matched_url not in chunk_results and len(chunk) == 1:
+            # API may canonicalize the URL; with one entry it's unambiguous
+            matched_url = chunk[0]
+        if matched_url in chunk_results:
+            chunk_results[matched_url].setdefault("matches", []).append(match)
+    return chunk_results
+
+
+def _post_threat_matches(urls: List[str]) -> Dict[str, Any]:
+    """Send one threatMatches:find request and map errors to exceptions.
+
+    Args:
+        urls: URLs for this request's threatEntries (max 500)
+
+    Returns:
+        Parsed JSON response from the API
+    """
     request_body = {
-        "client": {
-            "clientId": CLIENT_ID,
-            "clientVersion": CLIENT_VERSION
-        },
+        **_BODY_TEMPLATE,
         "threatInfo": {
-            "threatTypes": THREAT_TYPES,
-            "platformTypes": PLATFORM_TYPES,
-            "threatEntryTypes": THREAT_ENTRY_TYPES,
-            "threatEntries": [
-                {"url": url}
-            ]
+            **_BODY_TEMPLATE["threatInfo"],
+            "threatEntries": [{"url": url} for url in urls]
         }
     }
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
+
+    # Built per call: the key is resolved at call time (env reloads, tests)
     api_url = f"{GOOGLE_SAFE_BROWSING_API_ENDPOINT}?key={GOOGLE_SAFE_BROWSING_API_KEY}"
-    
+
+    # Pace the request so we stay under the API's per-minute quota
+    _bucket.acquire()
+
     try:
-        logger.info(f"Checking URL safety: {url}")
-        response = requests.post(
-            api_url,
-            json=request_body,
-            headers=headers,
-            timeout=REQUEST_TIMEOUT
-        )
-        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Checking safety of %d URL(s)", len(urls))
+        if ORJSON_AVAILABLE:
+            response = _session.post(
+                api_url,
+                data=orjson.dumps(request_body),
+                timeout=REQUEST_TIMEOUT,
+                stream=True
+            )
+        else:
+            response = _session.post(
+                api_url,
+                json=request_body,
+                timeout=REQUEST_TIMEOUT
+            )
+
         if response.status_code == 200:
-            result = response.json()
-            logger.info(f"Successfully checked URL: {url}")
+            # orjson.JSONDecodeError subclasses ValueError, so the
+            # existing parse-error handling below covers both parsers
+            if ORJSON_AVAILABLE:
+                # Accumulate the body in bounded chunks and parse the raw
+                # bytes directly, skipping the full-string decode that
+                # response.json() would do on large batch responses
+                body = bytearray()
+                for piece in response.iter_content(chunk_size=65536):
+                    body += piece
+                result = orjson.loads(bytes(body))
+            else:
+                result = response.json()
+            logger.info("Successfully checked %d URL(s)", len(urls))
             return result
         
         elif response.status_code == 400:
-            logger.error(f"Bad request - Invalid API key or malformed request: {response.text}")
+            logger.error("Bad request - Invalid API key or malformed request: %s", response.text)
             raise APIKeyError(f"Invalid API key or malformed request: {response.text}")
         
         elif response.status_code == 403:
-            logger.error(f"Forbidden - API key restrictions: {response.text}")
+            logger.error("Forbidden - API key restrictions: %s", response.text)
             raise APIKeyError(f"API key restrictions or permissions error: {response.text}")
         
         elif response.status_code == 429:
@@ -106,21 +461,21 @@ def check_url_safety(url: str) -> Dict[str, Any]:
             raise RateLimitError(f"Rate limit exceeded. Retry after: {retry_after}")
         
         else:
-            logger.error(f"Unexpected API response: {response.status_code} - {response.text}")
+            logger.error("Unexpected API response: %s - %s", response.status_code, response.text)
             raise SafeBrowsingAPIError(f"Unexpected API response: {response.status_code}")
     
     except requests.exceptions.Timeout:
-        logger.error(f"Request timeout after {REQUEST_TIMEOUT} seconds")
+        logger.error("Request timeout after %s seconds", REQUEST_TIMEOUT)
         raise NetworkError(f"Request timeout after {REQUEST_TIMEOUT} seconds")
     
     except requests.exceptions.ConnectionError as e:
-        logger.error(f"Network connection error: {str(e)}")
+        logger.error("Network connection error: %s", e)
         raise NetworkError(f"Failed to connect to Safe Browsing API: {str(e)}")
     
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {str(e)}")
+        logger.error("Request error: %s", e)
         raise SafeBrowsingAPIError(f"Request failed: {str(e)}")
     
     except ValueError as e:
-        logger.error(f"JSON parsing error: {str(e)}")
+        logger.error("JSON parsing error: %s", e)
         raise SafeBrowsingAPIError(f"Failed to parse API response: {str(e)}")
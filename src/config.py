@@ -21,3 +21,11 @@ PLATFORM_TYPES = ["ANY_PLATFORM"]
 THREAT_ENTRY_TYPES = ["URL"]
 
 REQUEST_TIMEOUT = 10
+
+# Client-side pacing of API requests (token bucket)
+REQUESTS_PER_MINUTE = 60
+REQUEST_BURST = 10
+
+# Concurrent analysis: cap per-domain parallelism and space same-domain checks
+MAX_PER_DOMAIN = 4
+INTRA_DOMAIN_DELAY = 0.05  # seconds between same-domain checks
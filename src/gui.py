@@ -1,21 +1,32 @@
 """Graphical User Interface for Link Safety Checker."""
+import atexit
+import io
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import threading
+from tkinter import font as tkfont
+import queue
+import re
 import sys
+import textwrap
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Only when executed as a plain script (python src/gui.py) does the
+# project root need adding to sys.path; package imports (python -m
+# src.gui, main.py) resolve without mutating the import path
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.api_client import check_url_safety, APIKeyError, RateLimitError, NetworkError, SafeBrowsingAPIError
-from src.response_parser import parse_safe_browsing_response
-from src.url_analyzer import analyze_url_complete
+# Analysis modules (and transitively requests/dotenv) are imported
+# lazily in the worker paths so the window paints sooner on cold start
 from src.gui_history import ScanHistory
-from src.gui_export import ExportManager
-from src.gui_share import ShareDialog
-from src.url_validator import URLValidator, URLValidationResult
+from src.url_validator import URLValidator, URLValidationResult, normalize_url
 
 # Try to import pyperclip, fallback to tkinter clipboard if not available
 try:
@@ -24,10 +35,201 @@ try:
 except ImportError:
     PYPERCLIP_AVAILABLE = False
 
+# Section separators for the threat details text, built once
+_SEP_HEAVY = "=" * 60
+_SEP_LIGHT = "─" * 60
+
+# One-shot structural URL split (scheme / host / rest), compiled at import.
+# The click handler matches this once to reject input with no usable host
+# before any scan work is dispatched
+_URL_RE = re.compile(
+    r"^(?:(?P<scheme>[a-zA-Z][a-zA-Z0-9+.\-]*)://)?"
+    r"(?P<host>[^/?#]+)(?P<rest>[/?#].*)?$")
+
+
+# Fallback for exceptions with no _ERROR_TABLE entry
+_ERR_UNEXPECTED = ("⚠️ Unexpected Error\n\n{}\n\n"
+                   "Please try again or contact support if the issue persists.")
+_STATUS_UNEXPECTED = "Unexpected error occurred"
+
+# Exception class -> (details message, status text) for scan failures.
+# Built on first use so importing this module doesn't pull in api_client
+_ERROR_TABLE = None
+
+
+def _get_error_table():
+    """Build (once) the table mapping API exceptions to UI messages."""
+    global _ERROR_TABLE
+    if _ERROR_TABLE is None:
+        from src.api_client import (
+            APIKeyError, RateLimitError, NetworkError, SafeBrowsingAPIError
+        )
+        _ERROR_TABLE = {
+            APIKeyError: (
+                "⚠️ API Key Error\n\nPlease configure your Google Safe Browsing API key in the .env file.\nGet your free API key from Google Cloud Console.",
+                "API key not configured"),
+            RateLimitError: (
+                "⏳ Rate Limit Exceeded\n\nToo many requests. Please wait a few minutes and try again.",
+                "Rate limit exceeded"),
+            NetworkError: (
+                "🌐 Connection Error\n\nCannot reach Google Safe Browsing API.\nPlease check your internet connection and try again.",
+                "Network connection failed"),
+            SafeBrowsingAPIError: (
+                "⚠️ Service Error\n\nUnable to complete the security check.\nPlease try again in a few moments.",
+                "API request failed"),
+        }
+    return _ERROR_TABLE
+
+
+def _wrap_details(text):
+    """Pre-wrap details text in Python so the label needs no Tk reflow."""
+    return "\n".join(textwrap.fill(line, width=80) for line in text.split("\n"))
+
+
+# Clipboard text for a scan result; only the four fields are interpolated
+_RESULT_COPY_TEMPLATE = """Link Safety Checker - Scan Result
+Status: {status}
+URL: {url}
+Threats: {threats}
+Scanned: {timestamp}"""
+
+
+# fromisoformat accepts a trailing 'Z' natively from 3.11 on; older
+# versions need it rewritten as an explicit UTC offset
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+
+def _parse_iso(timestamp_str):
+    """Parse an ISO timestamp, rewriting 'Z' only where fromisoformat
+    can't take it directly - the common offset form costs no copy."""
+    if not _FROMISO_HANDLES_Z and timestamp_str.endswith('Z'):
+        timestamp_str = timestamp_str[:-1] + '+00:00'
+    return datetime.fromisoformat(timestamp_str)
+
+
+@lru_cache(maxsize=512)
+def _format_timestamp(timestamp_str):
+    """Compute the absolute display string for an ISO timestamp.
+
+    A timestamp never changes once written, so each distinct one pays
+    the fromisoformat/strftime cost exactly once per session.
+    """
+    try:
+        return _parse_iso(timestamp_str).strftime("%b %d, %Y at %I:%M %p")
+    except (ValueError, TypeError):
+        return timestamp_str
+
+
+@lru_cache(maxsize=512)
+def _format_relative_time(timestamp_str, now_minute):
+    """Compute the relative-time display string for a timestamp.
+
+    Cached per (timestamp, minute): repeated renders of the same history
+    entries skip the ISO parsing and delta math until the minute rolls
+    over and the strings could actually change.
+    """
+    try:
+        dt = _parse_iso(timestamp_str)
+        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
+        seconds = (now - dt).total_seconds()
+
+        if seconds < 60:
+            return "Just now"
+        for cutoff, divisor, unit in _REL_UNITS:
+            if seconds < cutoff:
+                n = int(seconds / divisor)
+                return "%d %s%s ago" % (n, unit, "" if n == 1 else "s")
+        # After 1 week, switch to absolute format
+        return dt.strftime("%b %d, %Y at %I:%M %p")
+    except (ValueError, TypeError):
+        return timestamp_str
+
+
+# Relative-time buckets for _format_relative_time: one code path over a
+# table instead of an elif per unit
+_REL_UNITS = ((3600, 60, "minute"), (86400, 3600, "hour"),
+              (604800, 86400, "day"))
+
+# History-row time format and a pre-bound fromisoformat, resolved once
+# instead of per formatted row
+_TIME_FMT = "%m/%d %H:%M"
+_fromiso = datetime.fromisoformat
+
+# One validator for the process; it's stateless, so every GUI (and any
+# future caller in this module) can share the same instance
+_VALIDATOR = URLValidator()
+
+# Save-dialog filetype filters per export format, shared by single and
+# batch export instead of being rebuilt on each call
+_EXPORT_FILETYPES = {
+    'json': [("JSON files", "*.json")],
+    'csv': [("CSV files", "*.csv")],
+    'txt': [("Text files", "*.txt")]
+}
+
+
+@lru_cache(maxsize=256)
+def _format_scan_row(icon, url, timestamp, formatted_short):
+    """Build (and cache) the history listbox text for one scan.
+
+    Keyed on the scan's stable fields, so an unchanged row is formatted
+    once per session no matter how many refreshes replay it; in
+    particular the fromisoformat fallback for records saved before
+    formatted_short existed runs once instead of per refresh.
+    """
+    # Truncate URL if too long
+    if len(url) > 35:
+        url = url[:32] + "..."
+
+    time_str = formatted_short
+    if not time_str:
+        try:
+            time_str = _fromiso(timestamp).strftime(_TIME_FMT)
+        except (ValueError, TypeError):
+            time_str = "Unknown"
+
+    return "".join((icon, " ", url, "\n   ", time_str))
+
 
 class LinkSafetyCheckerGUI:
     """Main GUI application for Link Safety Checker."""
-    
+
+    # How long a cached verdict may be re-displayed without re-scanning
+    VERDICT_CACHE_TTL = 300  # seconds
+
+    # Shared status lookup tables, built once instead of per call
+    STATUS_ICONS = {"safe": "✅", "suspicious": "⚠️", "dangerous": "🚫"}
+    STATUS_COLORS = {"safe": "#00ff88", "suspicious": "#ffd700", "dangerous": "#ff3366"}
+    STATUS_TEXT = {
+        "safe": "Verification complete - Safe",
+        "suspicious": "Verification complete - Suspicious",
+        "dangerous": "Verification complete - Dangerous"
+    }
+
+    # Per-status presentation for display_result: icon, accent color,
+    # headline, the bullet prefix for reasons/threats, and fixed advice lines
+    STATUS_STYLE = {
+        "safe": {
+            "icon": "✅", "color": "#00ff88", "label": "SAFE TO VISIT",
+            "lead": None, "threat_label": None,
+            "static": ("✓ No threats detected",
+                       "✓ Verified by multiple security checks",
+                       "✓ This link appears to be legitimate and safe"),
+        },
+        "suspicious": {
+            "icon": "⚠️", "color": "#ffd700", "label": "POTENTIALLY SUSPICIOUS",
+            "lead": "⚠", "threat_label": "Detected",
+            "static": ("⚠ Proceed with extreme caution",
+                       "⚠ Consider avoiding this link"),
+        },
+        "dangerous": {
+            "icon": "🚫", "color": "#ff3366", "label": "⚠️ DANGEROUS - DO NOT VISIT ⚠️",
+            "lead": "🚨", "threat_label": "Threats",
+            "static": ("🚨 This site may harm your computer",
+                       "🚨 DO NOT click or visit this link!"),
+        },
+    }
+
     def __init__(self, root):
         """Initialize the GUI application."""
         self.root = root
@@ -45,6 +247,67 @@ class LinkSafetyCheckerGUI:
         # Initialize history manager
         self.history = ScanHistory()
         self.current_result = None  # Store current result for copying
+
+        # Persistent worker pool: reuses threads (and the pooled HTTPS
+        # session in api_client) across scans instead of one thread per click.
+        # The atexit hook covers exits that bypass the window-close handler
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lsc")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        atexit.register(self._executor.shutdown, wait=False)
+
+        # History writes go through a queue to a dedicated writer thread,
+        # which coalesces bursts into one file rewrite; scan workers never
+        # block on history disk I/O
+        self._history_queue = queue.SimpleQueue()
+        self._history_writer_thread = threading.Thread(
+            target=self._history_writer, name="lsc-history", daemon=True)
+        self._history_writer_thread.start()
+
+        # Batch-mode UI events: workers enqueue (callable, args) pairs and
+        # a single recurring drain timer applies them in ticks, rather
+        # than scheduling one after() callback per row
+        self._ui_queue = queue.SimpleQueue()
+
+        # Recent verdicts keyed by normalized URL: url -> (saved_at, verdict).
+        # Bounded LRU so a long session can't grow it without limit
+        self._verdict_cache = OrderedDict()
+        self._verdict_cache_max = 256
+
+        # Re-entrancy guard: True while a single-URL scan is running, so
+        # Enter-mashing or double-clicks can't enqueue duplicate scans;
+        # the click timestamp additionally debounces rapid re-triggers
+        self._scan_in_flight = False
+        self._last_click_monotonic = 0.0
+
+        # Whether the post-scan widgets (action row, timestamp, details
+        # button) are packed, so clear/display skip redundant pack churn
+        self._result_widgets_visible = False
+
+        # Last option values applied through _cfg, keyed by
+        # (widget id, option); lets repeat updates skip Tcl entirely
+        self._last_ui = {}
+
+        # LSC_MINIMAL_UI=1 drops the timestamp/details section entirely,
+        # leaving the leanest possible per-scan update
+        self._show_details_section = os.getenv("LSC_MINIMAL_UI") != "1"
+
+        # History listbox state: rows currently displayed and the scans
+        # backing them, so refreshes only touch changed rows and
+        # double-click lookups skip a second history read
+        self._displayed_rows = []
+        self._cached_scans = []
+
+        # Epoch-validated copy of the history file, so refreshes only hit
+        # the disk after a scan was written or the history cleared
+        self._history_cache = None
+        self._history_epoch = -1
+
+        # Epoch the displayed rows were rendered from; refreshes where
+        # nothing was written skip row formatting entirely
+        self._rows_epoch = -1
+
+        # Pending debounced-validation timer (see on_url_change)
+        self._validation_after_id = None
         
         # Batch mode variables
         self.batch_mode = False
@@ -56,10 +319,60 @@ class LinkSafetyCheckerGUI:
         self.recent_urls = []
         self.recent_urls_dropdown_visible = False
         
-        # URL validation
-        self.validator = URLValidator()
+        # URL validation. Results are memoized per URL string, so
+        # retyping, backspacing over, or re-pasting the same value skips
+        # the regex/urlparse work; the validator is stateless, making the
+        # cached results safe to reuse
+        self.validator = _VALIDATOR
+        self._validate_cached = lru_cache(maxsize=256)(self.validator.validate_url)
         self.validation_result = None
-        
+
+        # Shared font objects: Tk resolves each Font once and every widget
+        # referencing it reuses that resolution, instead of re-resolving a
+        # (family, size) tuple per widget
+        self._font_small = tkfont.Font(family="Segoe UI", size=9)
+        self._font_body = tkfont.Font(family="Segoe UI", size=10)
+        self._font_medium = tkfont.Font(family="Segoe UI", size=11)
+        self._font_bold = tkfont.Font(family="Segoe UI", size=12, weight="bold")
+        self._font_mono = tkfont.Font(family="Consolas", size=9)
+
+        # Shared option groups for the toolbar and primary buttons; classic
+        # tk widgets can't share a ttk.Style, so reusing one dict at
+        # construction is the nearest equivalent
+        self.FLAT_BUTTON_OPTS = {
+            "font": self._font_body,
+            "bg": "#2d2d44",
+            "activeforeground": "#1a1a2e",
+            "cursor": "hand2",
+            "relief": tk.FLAT,
+            "borderwidth": 0,
+            "padx": 15,
+            "pady": 8,
+        }
+        self.PRIMARY_BUTTON_OPTS = {
+            "font": self._font_bold,
+            "bg": "#00d4ff",
+            "fg": "#0f2027",
+            "activebackground": "#00ff88",
+            "activeforeground": "#0f2027",
+            "cursor": "hand2",
+            "relief": tk.FLAT,
+            "borderwidth": 0,
+            "padx": 30,
+            "pady": 10,
+        }
+        # Format buttons in the export popup dialogs
+        self.POPUP_BUTTON_OPTS = {
+            "font": self._font_medium,
+            "bg": "#00d4ff",
+            "fg": "#0f2027",
+            "cursor": "hand2",
+            "relief": tk.FLAT,
+            "padx": 30,
+            "pady": 10,
+            "width": 12,
+        }
+
         # Modern gradient background colors
         self.bg_gradient_top = "#0f2027"
         self.bg_gradient_mid = "#203a43"
@@ -91,7 +404,7 @@ class LinkSafetyCheckerGUI:
         history_header = tk.Label(
             history_header_frame,
             text="📜 Scan History",
-            font=("Segoe UI", 12, "bold"),
+            font=self._font_bold,
             bg="#1a1a2e",
             fg="#00d4ff"
         )
@@ -102,7 +415,7 @@ class LinkSafetyCheckerGUI:
             history_header_frame,
             text="🗑️",
             command=self.clear_scan_history,
-            font=("Segoe UI", 10),
+            font=self._font_body,
             bg="#2d2d44",
             fg="#ff6b6b",
             activebackground="#ff6b6b",
@@ -126,7 +439,7 @@ class LinkSafetyCheckerGUI:
         
         self.history_listbox = tk.Listbox(
             history_scroll_frame,
-            font=("Segoe UI", 9),
+            font=self._font_small,
             bg="#2d2d44",
             fg="#ffffff",
             selectbackground="#00d4ff",
@@ -141,56 +454,42 @@ class LinkSafetyCheckerGUI:
         # Bind double-click to re-analyze
         self.history_listbox.bind('<Double-Button-1>', self.on_history_select)
         
-        # Load initial history
-        self.refresh_history()
-        
-        # Compact header section with gradient effect
-        header_frame = tk.Frame(main_frame, bg=self.bg_gradient_top, relief=tk.FLAT)
-        header_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        # Shield icon - centered
-        icon_label = tk.Label(
-            header_frame,
-            text="🛡️",
-            font=("Segoe UI Emoji", 28),
-            bg=self.bg_gradient_top,
-            fg="#00d4ff"
-        )
-        icon_label.pack(anchor=tk.CENTER, pady=(10, 5))
-        
-        # Title and subtitle in vertical stack - centered
-        title_stack = tk.Frame(header_frame, bg=self.bg_gradient_top)
-        title_stack.pack(anchor=tk.CENTER, pady=(0, 5))
-        
-        # Modern title with gradient effect - smaller font
-        title_label = tk.Label(
-            title_stack,
-            text="Link Safety Checker",
-            font=("Segoe UI", 20, "bold"),
-            bg=self.bg_gradient_top,
-            fg="#ffffff"
-        )
-        title_label.pack(anchor=tk.CENTER)
-        
-        # Glowing subtitle - smaller
-        subtitle_label = tk.Label(
-            title_stack,
-            text="⚡ API + AI-Powered Rule-Based Analysis ⚡",
-            font=("Segoe UI", 9),
+        # Initial history is loaded asynchronously at the end of __init__
+
+        # Compact header section: the icon, title, subtitle and brand never
+        # change, so render them as text items on one Canvas instead of a
+        # stack of Frames and Labels - a single widget for the geometry
+        # manager and a single repaint target
+        header_canvas = tk.Canvas(
+            main_frame,
+            height=118,
             bg=self.bg_gradient_top,
-            fg="#00d4ff"
+            highlightthickness=0
         )
-        subtitle_label.pack(anchor=tk.CENTER)
-        
-        # Organization branding - smaller and centered below subtitle
-        brand_label = tk.Label(
-            header_frame,
-            text="Developed by AlesSystems",
-            font=("Segoe UI", 8, "italic"),
-            bg=self.bg_gradient_top,
-            fg="#7f8c8d"
+        header_canvas.pack(fill=tk.X, pady=(0, 15))
+
+        header_items = (
+            header_canvas.create_text(
+                0, 30, text="🛡️",
+                font=("Segoe UI Emoji", 28), fill="#00d4ff"),
+            header_canvas.create_text(
+                0, 68, text="Link Safety Checker",
+                font=("Segoe UI", 20, "bold"), fill="#ffffff"),
+            header_canvas.create_text(
+                0, 92, text="⚡ API + AI-Powered Rule-Based Analysis ⚡",
+                font=self._font_small, fill="#00d4ff"),
+            header_canvas.create_text(
+                0, 108, text="Developed by AlesSystems",
+                font=("Segoe UI", 8, "italic"), fill="#7f8c8d"),
         )
-        brand_label.pack(anchor=tk.CENTER, pady=(0, 5))
+
+        def center_header(event):
+            # Keep the static text centered as the window resizes
+            x = event.width / 2
+            for item in header_items:
+                header_canvas.coords(item, x, header_canvas.coords(item)[1])
+
+        header_canvas.bind('<Configure>', center_header)
         
         # Card-style input container - more compact
         input_card = tk.Frame(
@@ -219,7 +518,7 @@ class LinkSafetyCheckerGUI:
         url_label = tk.Label(
             url_label_frame,
             text="Enter URL to analyze:",
-            font=("Segoe UI", 12, "bold"),
+            font=self._font_bold,
             bg="#1a1a2e",
             fg="#ffffff"
         )
@@ -246,15 +545,16 @@ class LinkSafetyCheckerGUI:
         self.url_entry.focus()
         
         # Bind Enter key to analyze
-        self.url_entry.bind('<Return>', lambda e: self.analyze_url())
+        # "break" stops Tk from propagating held-key repeats of Return
+        self.url_entry.bind('<Return>', self._on_return_key)
         self.url_entry.bind('<FocusIn>', self.on_entry_focus)
         self.url_entry.bind('<FocusOut>', self.on_entry_unfocus)
         # Feature 8: Real-time URL validation
         self.url_var.trace('w', self.on_url_change)
         
-        # Load recent URLs from history
-        self.load_recent_urls()
-        
+        # Recent URLs are loaded with the initial history at the end of
+        # __init__
+
         # Button row (Copy URL and Clear buttons) - more compact
         button_row = tk.Frame(input_card, bg="#1a1a2e")
         button_row.pack(fill=tk.X, padx=20, pady=(0, 12))
@@ -263,16 +563,9 @@ class LinkSafetyCheckerGUI:
             button_row,
             text="📋 Copy URL",
             command=self.copy_url_to_clipboard,
-            font=("Segoe UI", 10),
-            bg="#2d2d44",
             fg="#00d4ff",
             activebackground="#00d4ff",
-            activeforeground="#1a1a2e",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=15,
-            pady=8,
-            borderwidth=0
+            **self.FLAT_BUTTON_OPTS
         )
         self.copy_url_button.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -280,16 +573,9 @@ class LinkSafetyCheckerGUI:
             button_row,
             text="🗑️ Clear",
             command=self.clear_all,
-            font=("Segoe UI", 10),
-            bg="#2d2d44",
             fg="#ff6b6b",
             activebackground="#ff6b6b",
-            activeforeground="#1a1a2e",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=15,
-            pady=8,
-            borderwidth=0
+            **self.FLAT_BUTTON_OPTS
         )
         self.clear_button.pack(side=tk.LEFT)
         
@@ -301,16 +587,9 @@ class LinkSafetyCheckerGUI:
             self.result_actions_row,
             text="📋 Copy Result",
             command=self.copy_result_to_clipboard,
-            font=("Segoe UI", 10),
-            bg="#2d2d44",
             fg="#00d4ff",
             activebackground="#00d4ff",
-            activeforeground="#1a1a2e",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=15,
-            pady=8,
-            borderwidth=0
+            **self.FLAT_BUTTON_OPTS
         )
         self.copy_result_button.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -318,16 +597,9 @@ class LinkSafetyCheckerGUI:
             self.result_actions_row,
             text="📤 Export Result",
             command=self.export_result,
-            font=("Segoe UI", 10),
-            bg="#2d2d44",
             fg="#00ff88",
             activebackground="#00ff88",
-            activeforeground="#1a1a2e",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=15,
-            pady=8,
-            borderwidth=0
+            **self.FLAT_BUTTON_OPTS
         )
         self.export_button.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -335,16 +607,9 @@ class LinkSafetyCheckerGUI:
             self.result_actions_row,
             text="🔗 Share Result",
             command=self.share_result,
-            font=("Segoe UI", 10),
-            bg="#2d2d44",
             fg="#6366f1",
             activebackground="#6366f1",
-            activeforeground="#ffffff",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=15,
-            pady=8,
-            borderwidth=0
+            **dict(self.FLAT_BUTTON_OPTS, activeforeground="#ffffff")
         )
         self.share_button.pack(side=tk.LEFT)
         
@@ -353,16 +618,9 @@ class LinkSafetyCheckerGUI:
             button_row,
             text="📊 Batch Mode",
             command=self.toggle_batch_mode,
-            font=("Segoe UI", 10),
-            bg="#2d2d44",
             fg="#00d4ff",
             activebackground="#00d4ff",
-            activeforeground="#1a1a2e",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=15,
-            pady=8,
-            borderwidth=0
+            **self.FLAT_BUTTON_OPTS
         )
         self.mode_toggle_button.pack(side=tk.RIGHT)
         
@@ -370,40 +628,19 @@ class LinkSafetyCheckerGUI:
         self.validation_indicator = tk.Label(
             input_card,
             text="",
-            font=("Segoe UI", 9),
+            font=self._font_small,
             bg="#1a1a2e",
             fg="#b8b8d1"
         )
         self.validation_indicator.pack(fill=tk.X, padx=20, pady=(0, 8))
         
-        # Batch input frame (Feature 6) - hidden by default
-        self.batch_input_frame = tk.Frame(input_card, bg="#1a1a2e")
-        
-        batch_label = tk.Label(
-            self.batch_input_frame,
-            text="📋 Enter URLs (one per line):",
-            font=("Segoe UI", 11, "bold"),
-            bg="#1a1a2e",
-            fg="#00d4ff"
-        )
-        batch_label.pack(pady=(10, 5), padx=25, anchor=tk.W)
-        
-        # Scrolled text for batch input
-        batch_text_frame = tk.Frame(self.batch_input_frame, bg="#1a1a2e")
-        batch_text_frame.pack(fill=tk.BOTH, expand=True, padx=25, pady=(0, 10))
-        
-        self.batch_text = scrolledtext.ScrolledText(
-            batch_text_frame,
-            font=("Segoe UI", 10),
-            bg="#2d2d44",
-            fg="#ffffff",
-            insertbackground="#00d4ff",
-            relief=tk.FLAT,
-            height=8,
-            wrap=tk.WORD
-        )
-        self.batch_text.pack(fill=tk.BOTH, expand=True)
-        
+        # Batch input frame (Feature 6) - built lazily on first batch
+        # toggle (see _ensure_batch_ui); most sessions never enter batch
+        # mode, so its widgets stay off the startup path
+        self._input_card = input_card
+        self.batch_input_frame = None
+        self.batch_text = None
+
         # Recent URLs dropdown button (Feature 9)
         self.recent_urls_button = tk.Button(
             entry_frame,
@@ -420,40 +657,14 @@ class LinkSafetyCheckerGUI:
         )
         self.recent_urls_button.place(relx=0.98, rely=0.5, anchor=tk.E)
         
-        # Recent URLs dropdown listbox (Feature 9) - hidden by default
-        self.recent_urls_listbox_frame = tk.Frame(
-            input_card,
-            bg="#2d2d44",
-            relief=tk.FLAT,
-            highlightthickness=1,
-            highlightbackground="#00d4ff"
-        )
-        
-        recent_scroll = tk.Scrollbar(self.recent_urls_listbox_frame)
-        recent_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.recent_urls_listbox = tk.Listbox(
-            self.recent_urls_listbox_frame,
-            font=("Segoe UI", 9),
-            bg="#2d2d44",
-            fg="#ffffff",
-            selectbackground="#00d4ff",
-            selectforeground="#1a1a2e",
-            relief=tk.FLAT,
-            height=6,
-            yscrollcommand=recent_scroll.set
-        )
-        self.recent_urls_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        recent_scroll.config(command=self.recent_urls_listbox.yview)
-        
-        self.recent_urls_listbox.bind('<<ListboxSelect>>', self.on_recent_url_select)
-        
-        # Clear history option in recent URLs
-        self.recent_urls_listbox.bind('<Button-3>', self.show_recent_urls_context_menu)
-        
+        # Recent URLs dropdown listbox (Feature 9) - built lazily on
+        # first open (see _ensure_recent_urls_ui)
+        self.recent_urls_listbox_frame = None
+        self.recent_urls_listbox = None
+
         # Bind keyboard shortcuts
-        self.root.bind('<Control-l>', lambda e: self.clear_all())
-        self.root.bind('<Escape>', lambda e: self.clear_all())
+        self.root.bind('<Control-l>', self._on_clear_shortcut)
+        self.root.bind('<Escape>', self._on_clear_shortcut)
         
         # Modern gradient button with hover effect - more compact
         button_frame = tk.Frame(main_frame, bg=self.bg_gradient_mid)
@@ -463,52 +674,15 @@ class LinkSafetyCheckerGUI:
             button_frame,
             text="🔍  ANALYZE LINK",
             command=self.analyze_url,
-            font=("Segoe UI", 12, "bold"),
-            bg="#00d4ff",
-            fg="#0f2027",
-            activebackground="#00ff88",
-            activeforeground="#0f2027",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=30,
-            pady=10,
-            borderwidth=0
+            **self.PRIMARY_BUTTON_OPTS
         )
         self.analyze_button.pack(side=tk.LEFT, padx=5)
         
-        # Batch analyze button (Feature 6) - hidden by default
-        self.batch_analyze_button = tk.Button(
-            button_frame,
-            text="📊  ANALYZE BATCH",
-            command=self.analyze_batch,
-            font=("Segoe UI", 12, "bold"),
-            bg="#00d4ff",
-            fg="#0f2027",
-            activebackground="#00ff88",
-            activeforeground="#0f2027",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=30,
-            pady=10,
-            borderwidth=0
-        )
-        
-        # Cancel batch button (Feature 6) - hidden by default
-        self.cancel_batch_button = tk.Button(
-            button_frame,
-            text="⛔ CANCEL",
-            command=self.cancel_batch_processing,
-            font=("Segoe UI", 11, "bold"),
-            bg="#ff6b6b",
-            fg="#ffffff",
-            activebackground="#ff3366",
-            activeforeground="#ffffff",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=25,
-            pady=10,
-            borderwidth=0
-        )
+        # Batch analyze/cancel buttons (Feature 6) - built with the rest
+        # of the batch UI on first toggle
+        self._button_frame = button_frame
+        self.batch_analyze_button = None
+        self.cancel_batch_button = None
         
         # Add hover effects
         self.analyze_button.bind('<Enter>', self.on_button_hover)
@@ -590,34 +764,25 @@ class LinkSafetyCheckerGUI:
         )
         self.result_label.pack(pady=(0, 8))
         
-        # Details label - dynamic wraplength
+        # Details label - text is pre-wrapped with textwrap before display,
+        # so Tk never reflows it on geometry changes
         self.details_label = tk.Label(
             self.result_card,
             text="",
-            font=("Segoe UI", 10),
+            font=self._font_body,
             bg="#1a1a2e",
-            wraplength=500,
             justify=tk.CENTER,
             fg="#b8b8d1"
         )
         self.details_label.pack(pady=(0, 10))
-        
-        # Bind window resize to update wraplength dynamically
-        def update_wraplength(event=None):
-            try:
-                # Get actual main_frame width
-                main_frame_width = self.main_frame.winfo_width()
-                if main_frame_width > 1:  # Only update if frame is actually rendered
-                    # Calculate available width (account for padding ~40px)
-                    available_width = max(400, main_frame_width - 40)
-                    self.result_label.config(wraplength=available_width)
-                    self.details_label.config(wraplength=available_width)
-            except:
-                pass  # Ignore errors during initial setup
-        
-        # Update wraplength on window resize
-        self.main_frame.bind('<Configure>', update_wraplength)
-        self.root.bind('<Configure>', update_wraplength)
+
+        # Update wraplength on window resize, debounced: <Configure>
+        # fires per dragged pixel, so each event just reschedules a 50 ms
+        # timer and only the final size pays the winfo/config work. Only
+        # main_frame is bound - a root resize reconfigures it transitively
+        self._wraplength_after_id = None
+        self._last_wrap_width = -1
+        self.main_frame.bind('<Configure>', self._schedule_wraplength_update)
         
         # Timestamp label (Feature 5) - more compact
         self.timestamp_label = tk.Label(
@@ -634,7 +799,7 @@ class LinkSafetyCheckerGUI:
             self.result_card,
             text="📋 View Details",
             command=self.toggle_threat_details,
-            font=("Segoe UI", 9),
+            font=self._font_small,
             bg="#2d2d44",
             fg="#00d4ff",
             activebackground="#00d4ff",
@@ -647,124 +812,34 @@ class LinkSafetyCheckerGUI:
         )
         # Don't pack initially, will be shown after scan
         
-        # Threat details frame (Feature 4) - expandable section
-        self.threat_details_frame = tk.Frame(
-            self.result_card,
-            bg="#1a1a2e"
-        )
+        # Threat details frame (Feature 4) - expandable section. The frame,
+        # Text widget and scrollbar are built lazily on first toggle since
+        # most sessions never open the panel.
+        self.threat_details_frame = None
+        self.threat_details_text = None
         self.threat_details_visible = False
-        
-        # Threat details text widget with scrollbar - more compact
-        details_scroll_frame = tk.Frame(self.threat_details_frame, bg="#1a1a2e")
-        details_scroll_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=8)
-        
-        details_scrollbar = tk.Scrollbar(details_scroll_frame)
-        details_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.threat_details_text = tk.Text(
-            details_scroll_frame,
-            font=("Consolas", 9),
-            bg="#2d2d44",
-            fg="#ffffff",
-            relief=tk.FLAT,
-            wrap=tk.WORD,
-            height=8,
-            yscrollcommand=details_scrollbar.set,
-            state=tk.DISABLED
-        )
-        self.threat_details_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        details_scrollbar.config(command=self.threat_details_text.yview)
+        self._details_verdict = None
+        self._details_dirty = False
         
         # Note: Copy Result, Export, and Share buttons are now in the input card area
         # They are defined in __init__ under result_actions_row
         
-        # Batch results frame (Feature 6) - hidden by default
-        self.batch_results_frame = tk.Frame(
-            self.result_card,
-            bg="#1a1a2e"
-        )
-        
-        batch_results_label = tk.Label(
-            self.batch_results_frame,
-            text="📊 Batch Scan Results",
-            font=("Segoe UI", 14, "bold"),
-            bg="#1a1a2e",
-            fg="#00d4ff"
-        )
-        batch_results_label.pack(pady=(10, 5))
-        
-        # Summary stats frame
-        self.batch_summary_frame = tk.Frame(
-            self.batch_results_frame,
-            bg="#2d2d44",
-            relief=tk.FLAT
-        )
-        self.batch_summary_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        self.batch_summary_label = tk.Label(
-            self.batch_summary_frame,
-            text="",
-            font=("Segoe UI", 11),
-            bg="#2d2d44",
-            fg="#ffffff",
-            justify=tk.LEFT
-        )
-        self.batch_summary_label.pack(pady=10, padx=15)
-        
-        # Progress label
-        self.batch_progress_label = tk.Label(
-            self.batch_results_frame,
-            text="",
-            font=("Segoe UI", 10, "italic"),
-            bg="#1a1a2e",
-            fg="#ffd700"
-        )
-        self.batch_progress_label.pack(pady=5)
-        
-        # Batch results list with scrollbar
-        batch_scroll_frame = tk.Frame(self.batch_results_frame, bg="#1a1a2e")
-        batch_scroll_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        batch_scrollbar = tk.Scrollbar(batch_scroll_frame)
-        batch_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.batch_results_listbox = tk.Listbox(
-            batch_scroll_frame,
-            font=("Consolas", 9),
-            bg="#2d2d44",
-            fg="#ffffff",
-            selectbackground="#00d4ff",
-            selectforeground="#0f2027",
-            relief=tk.FLAT,
-            height=10,
-            yscrollcommand=batch_scrollbar.set
-        )
-        self.batch_results_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        batch_scrollbar.config(command=self.batch_results_listbox.yview)
-        
-        # Export batch button - more compact
-        self.export_batch_button = tk.Button(
-            self.batch_results_frame,
-            text="📤 Export Batch Results",
-            command=self.export_batch_results,
-            font=("Segoe UI", 10, "bold"),
-            bg="#00ff88",
-            fg="#0f2027",
-            activebackground="#00d4ff",
-            activeforeground="#0f2027",
-            cursor="hand2",
-            relief=tk.FLAT,
-            padx=25,
-            pady=8,
-            borderwidth=0
-        )
-        self.export_batch_button.pack(pady=10)
+        # Batch results frame (Feature 6) - built with the rest of the
+        # batch UI on first toggle
+        self.batch_results_frame = None
+        self.batch_results_listbox = None
+
+        # Export-format chooser - one Toplevel shared by single and
+        # batch export, built on first use and recycled with
+        # withdraw/deiconify between exports
+        self._fmt_dialog = None
+        self._fmt_on_select = None
         
         # Modern status bar
         self.status_label = tk.Label(
             root,
             text="● Ready",
-            font=("Segoe UI", 10),
+            font=self._font_body,
             fg="#00d4ff",
             bg="#0f2027",
             anchor=tk.W,
@@ -772,7 +847,89 @@ class LinkSafetyCheckerGUI:
             pady=8
         )
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
-    
+
+        # Read the history file off the main thread so the window is
+        # interactive before the first disk read finishes; the widget
+        # population is scheduled back onto the Tk event loop
+        threading.Thread(
+            target=self._async_initial_load,
+            name="lsc-initial-load",
+            daemon=True
+        ).start()
+
+    def _async_initial_load(self):
+        """Warm the history cache off-thread, then populate the widgets.
+
+        load_scan_history does the JSON read and caches the result, so
+        the refresh_history and load_recent_urls calls scheduled here run
+        on the main thread against the in-memory copy.
+        """
+        try:
+            self.history.load_scan_history()
+        except Exception as e:
+            print(f"Error preloading history: {e}")
+        try:
+            self.root.after(0, self.refresh_history)
+            self.root.after(0, self.load_recent_urls)
+        except tk.TclError:
+            # Window was destroyed before the load finished
+            pass
+
+    @staticmethod
+    def _verdict_cache_key(url):
+        """Normalize a URL into a verdict-cache key.
+
+        Trailing slashes stay in the key - '/path/' and '/path' are
+        distinct resources, same as in normalize_url itself. The one
+        fold is the bare root: 'https://host/' and 'https://host' name
+        the same document.
+        """
+        key = normalize_url(url)
+        # A trailing slash with exactly three '/' total is the root one
+        # right after 'scheme://host'
+        if key.endswith('/') and key.count('/') == 3:
+            key = key[:-1]
+        return key
+
+    def _history_writer(self):
+        """Drain queued scans into history, batching bursts into one write.
+
+        Runs on a dedicated daemon thread. A None item is the shutdown
+        sentinel; scans queued before it are still flushed.
+        """
+        while True:
+            item = self._history_queue.get()
+            if item is None:
+                return
+            items = [item]
+            # Absorb scans arriving within a short window so a batch run
+            # costs a handful of file rewrites instead of one per URL
+            deadline = time.monotonic() + 0.2
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._history_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self.history.save_scans_batch(items)
+                    return
+                items.append(nxt)
+            self.history.save_scans_batch(items)
+            self.root.after(0, self.refresh_history)
+
+    def on_close(self):
+        """Shut down background workers and close the application."""
+        # Flush any queued history writes before tearing down
+        self._history_queue.put(None)
+        self._history_writer_thread.join(timeout=2)
+        self._executor.shutdown(wait=False)
+        from src.api_client import close_session
+        close_session()
+        self.root.destroy()
+
     def on_entry_focus(self, event):
         """Handle entry field focus."""
         self.url_entry.config(highlightbackground="#00ff88")
@@ -804,6 +961,47 @@ class LinkSafetyCheckerGUI:
         """Update status bar message."""
         self.status_label.config(text=f"● {message}", fg=color)
     
+    def _schedule_wraplength_update(self, event=None):
+        """Debounce resize events into one wraplength recompute."""
+        if self._wraplength_after_id is not None:
+            self.root.after_cancel(self._wraplength_after_id)
+        self._wraplength_after_id = self.root.after(50, self._apply_wraplength)
+
+    def _apply_wraplength(self):
+        """Fit the result label's wraplength to the settled frame width."""
+        self._wraplength_after_id = None
+        try:
+            # Get actual main_frame width
+            main_frame_width = self.main_frame.winfo_width()
+            # Skip near-identical widths (vertical-only resizes, 1-2 px
+            # jitter): a few pixels never change where the text wraps
+            if abs(main_frame_width - self._last_wrap_width) < 8:
+                return
+            if main_frame_width > 1:  # Only update if frame is actually rendered
+                self._last_wrap_width = main_frame_width
+                # Calculate available width (account for padding ~40px)
+                available_width = max(400, main_frame_width - 40)
+                self._cfg(self.result_label, wraplength=available_width)
+        except tk.TclError:
+            pass  # Ignore errors during initial setup
+
+    def _cfg(self, widget, **kwargs):
+        """Configure a widget in one call, skipping options already set.
+
+        Dropping no-op assignments avoids the redraw Tk schedules for every
+        configure, which matters when clear_results/display_result re-apply
+        the same colors scan after scan. Last-applied values are memoized
+        per (widget, option) so repeats cost no Tcl traffic at all - not
+        even the cget round trips a query-and-diff would need.
+        """
+        last = self._last_ui
+        wid = id(widget)
+        changed = {k: v for k, v in kwargs.items() if last.get((wid, k)) != v}
+        if changed:
+            widget.configure(**changed)
+            for k, v in changed.items():
+                last[(wid, k)] = v
+
     def disable_button(self):
         """Disable analyze button during processing."""
         self.analyze_button.config(state=tk.DISABLED, bg="#555577", cursor="wait")
@@ -811,29 +1009,33 @@ class LinkSafetyCheckerGUI:
     
     def enable_button(self):
         """Enable analyze button after processing."""
+        self._scan_in_flight = False
         self.analyze_button.config(state=tk.NORMAL, bg="#00d4ff", cursor="hand2")
         self.url_entry.config(state=tk.NORMAL)
     
     def clear_results(self):
         """Clear previous results."""
-        self.result_icon.config(text="")
-        self.result_label.config(text="", fg="#ffffff")
-        self.details_label.config(text="", fg="#b8b8d1")
-        self.result_card.config(highlightbackground="#2d2d44")
-        # Hide result action buttons in input area
-        if hasattr(self, 'result_actions_row'):
-            self.result_actions_row.pack_forget()
-        self.timestamp_label.pack_forget()  # Hide timestamp
-        self.view_details_button.pack_forget()  # Hide view details button
-        self.threat_details_frame.pack_forget()  # Hide threat details
+        self._cfg(self.result_icon, text="")
+        self._cfg(self.result_label, text="", fg="#ffffff")
+        self._cfg(self.details_label, text="", fg="#b8b8d1")
+        self._cfg(self.result_card, highlightbackground="#2d2d44")
+        # Hide result widgets, skipping the geometry churn when they are
+        # already hidden (each forget recomputes the parent's layout)
+        if self._result_widgets_visible:
+            if hasattr(self, 'result_actions_row'):
+                self.result_actions_row.pack_forget()
+            self.timestamp_label.pack_forget()  # Hide timestamp
+            self.view_details_button.pack_forget()  # Hide view details button
+            if self.threat_details_frame is not None:
+                self.threat_details_frame.pack_forget()  # Hide threat details
+            self._result_widgets_visible = False
         self.threat_details_visible = False
         self.current_result = None
-        # Clean up button_row if it exists
-        if hasattr(self, 'button_row'):
-            self.button_row.pack_forget()
-            self.button_row.destroy()
-            delattr(self, 'button_row')
     
+    def _on_clear_shortcut(self, event):
+        """Handle the Ctrl-L / Escape clear shortcuts."""
+        self.clear_all()
+
     def clear_all(self):
         """Clear all input and results, reset UI to initial state."""
         self.url_var.set("")
@@ -841,29 +1043,76 @@ class LinkSafetyCheckerGUI:
         self.set_status("Ready", "#00d4ff")
         self.url_entry.focus()
     
+    def _format_history_row(self, scan):
+        """Build the listbox display text for one history record."""
+        return _format_scan_row(
+            self.STATUS_ICONS.get(scan['status'], "❓"),
+            scan['url'],
+            scan.get('timestamp'),
+            scan.get('formatted_short'))
+
+    def _get_recent_scans(self, count=50):
+        """Read recent scans through the epoch-validated memory cache.
+
+        ScanHistory bumps its epoch on every write, so the JSON file is
+        only re-read after a new scan or a clear.
+
+        Args:
+            count: Number of recent scans to return
+
+        Returns:
+            List of recent scan entries
+        """
+        if self._history_cache is None or self._history_epoch != self.history.epoch:
+            self._history_cache = self.history.get_recent_scans(50)
+            self._history_epoch = self.history.epoch
+        return self._history_cache[:count]
+
     def refresh_history(self):
         """Refresh the history listbox with recent scans."""
-        self.history_listbox.delete(0, tk.END)
-        recent_scans = self.history.get_recent_scans(50)
-        
-        for scan in recent_scans:
-            # Format: status icon + truncated URL
-            status_icons = {"safe": "✅", "suspicious": "⚠️", "dangerous": "🚫"}
-            icon = status_icons.get(scan['status'], "❓")
-            url = scan['url']
-            # Truncate URL if too long
-            if len(url) > 35:
-                url = url[:32] + "..."
-            
-            # Parse timestamp for display
-            try:
-                dt = datetime.fromisoformat(scan['timestamp'])
-                time_str = dt.strftime("%m/%d %H:%M")
-            except:
-                time_str = "Unknown"
-            
-            display_text = f"{icon} {url}\n   {time_str}"
-            self.history_listbox.insert(tk.END, display_text)
+        # During a batch, the writer thread flushes every fraction of a
+        # second; defer the repaints and let the single refresh after
+        # finish_batch_processing catch the sidebar up in one pass
+        if self.batch_processing:
+            return
+        # Rows can only change when the history epoch does, so a refresh
+        # that races ahead of the async history write (or is otherwise
+        # redundant) costs one int compare instead of 50 format calls
+        if self._rows_epoch == self.history.epoch:
+            return
+        self._rows_epoch = self.history.epoch
+
+        recent_scans = self._get_recent_scans(50)
+        rows = [self._format_history_row(scan) for scan in recent_scans]
+        self._cached_scans = recent_scans
+
+        if rows == self._displayed_rows:
+            return
+
+        # New scans prepend to history: look for the old rows - minus any
+        # tail trimmed by the 50-row cap - surviving as a suffix of the
+        # new ones, so a scan costs a head insert (plus a tail trim at
+        # the cap) instead of rebuilding all 50 rows
+        old = self._displayed_rows
+        new_count = None
+        for k in range(min(len(rows), 10) + 1):
+            if rows[k:] == old[:len(rows) - k]:
+                new_count = k
+                break
+
+        # Listbox insert is variadic, so each branch is one Tcl call
+        # rather than one interpreter transition per row
+        if old and new_count is not None:
+            if new_count:
+                self.history_listbox.insert(0, *rows[:new_count])
+            if len(old) + new_count > len(rows):
+                self.history_listbox.delete(len(rows), tk.END)
+        else:
+            self.history_listbox.delete(0, tk.END)
+            if rows:
+                self.history_listbox.insert(tk.END, *rows)
+
+        self._displayed_rows = rows
     
     def clear_scan_history(self):
         """Clear all scan history with confirmation."""
@@ -886,110 +1135,312 @@ class LinkSafetyCheckerGUI:
             return
         
         index = selection[0]
-        scans = self.history.get_recent_scans(50)
-        
+        scans = self._cached_scans
+
         if index < len(scans):
             url = scans[index]['url']
             self.url_var.set(url)
             self.analyze_url()
     
+    def _tk_clipboard_copy(self, text):
+        """Clipboard fallback via Tk when pyperclip is unavailable.
+
+        update_idletasks flushes the clipboard claim without pumping the
+        whole event loop.
+        """
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+        self.root.update_idletasks()
+
+    def _copy_async(self, text, success_msg, failure_prefix):
+        """Copy text to the clipboard without stalling the UI thread.
+
+        pyperclip shells out to a helper process (xclip/xsel) on Linux,
+        a perceptible hitch when run on the main thread, so that backend
+        goes through the worker pool with the status update marshalled
+        back via after(). The Tk fallback needs the main thread and is
+        cheap, so it stays synchronous.
+        """
+        if PYPERCLIP_AVAILABLE:
+            self._executor.submit(self._do_copy, text, success_msg, failure_prefix)
+        else:
+            try:
+                self._tk_clipboard_copy(text)
+                self.set_status(success_msg, "#00ff88")
+            except Exception as e:
+                self.set_status(f"{failure_prefix}: {str(e)}", "#ff6b6b")
+
+    def _do_copy(self, text, success_msg, failure_prefix):
+        """Worker-side pyperclip write plus scheduled status update."""
+        try:
+            pyperclip.copy(text)
+            self.root.after(0, self.set_status, success_msg, "#00ff88")
+        except Exception as e:
+            self.root.after(0, self.set_status,
+                            f"{failure_prefix}: {str(e)}", "#ff6b6b")
+
     def copy_url_to_clipboard(self):
         """Copy the current URL to clipboard."""
         url = self.url_var.get().strip()
         if not url:
             self.set_status("No URL to copy", "#ff6b6b")
             return
-        
-        try:
-            if PYPERCLIP_AVAILABLE:
-                pyperclip.copy(url)
-            else:
-                self.root.clipboard_clear()
-                self.root.clipboard_append(url)
-                self.root.update()
-            
-            self.set_status("✓ URL copied to clipboard", "#00ff88")
-        except Exception as e:
-            self.set_status(f"Failed to copy URL: {str(e)}", "#ff6b6b")
+
+        self._copy_async(url, "✓ URL copied to clipboard", "Failed to copy URL")
     
     def copy_result_to_clipboard(self):
         """Copy the formatted scan result to clipboard."""
         if not self.current_result:
             self.set_status("No result to copy", "#ff6b6b")
             return
-        
-        try:
-            # Format result text
-            url = self.url_var.get().strip()
-            status = self.current_result['status'].upper()
-            threats = ", ".join(self.current_result['threats']) if self.current_result['threats'] else "None"
-            timestamp = self.current_result['timestamp']
-            
-            result_text = f"""Link Safety Checker - Scan Result
-Status: {status}
-URL: {url}
-Threats: {threats}
-Scanned: {timestamp}"""
-            
-            if PYPERCLIP_AVAILABLE:
-                pyperclip.copy(result_text)
-            else:
-                self.root.clipboard_clear()
-                self.root.clipboard_append(result_text)
-                self.root.update()
-            
-            self.set_status("✓ Result copied to clipboard", "#00ff88")
-        except Exception as e:
-            self.set_status(f"Failed to copy result: {str(e)}", "#ff6b6b")
-    
-    def format_timestamp(self, timestamp_str: str) -> str:
-        """Format timestamp for display (Feature 5).
-        
-        Args:
-            timestamp_str: ISO format timestamp string
-            
-        Returns:
-            Formatted timestamp string like "Jan 15, 2024 at 10:30 AM"
-        """
-        try:
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            return dt.strftime("%b %d, %Y at %I:%M %p")
-        except:
-            return timestamp_str
-    
-    def format_relative_time(self, timestamp_str: str) -> str:
-        """Format timestamp as relative time (Feature 5).
-        
-        Args:
-            timestamp_str: ISO format timestamp string
-            
-        Returns:
-            Relative time string like "2 minutes ago" or absolute for old scans
-        """
-        try:
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
-            diff = now - dt
-            
-            seconds = diff.total_seconds()
-            
-            if seconds < 60:
-                return "Just now"
-            elif seconds < 3600:
-                minutes = int(seconds / 60)
-                return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-            elif seconds < 86400:
-                hours = int(seconds / 3600)
-                return f"{hours} hour{'s' if hours != 1 else ''} ago"
-            elif seconds < 604800:  # Less than a week
-                days = int(seconds / 86400)
-                return f"{days} day{'s' if days != 1 else ''} ago"
-            else:
-                # After 1 week, switch to absolute format
-                return dt.strftime("%b %d, %Y at %I:%M %p")
-        except:
-            return timestamp_str
-    
+        
+        try:
+            # Format result text
+            url = self.url_var.get().strip()
+            status = self.current_result['status'].upper()
+            threats = ", ".join(self.current_result['threats']) if self.current_result['threats'] else "None"
+            timestamp = self.current_result['timestamp']
+            
+            result_text = _RESULT_COPY_TEMPLATE.format(
+                status=status, url=url, threats=threats, timestamp=timestamp)
+
+            self._copy_async(result_text, "✓ Result copied to clipboard",
+                             "Failed to copy result")
+        except Exception as e:
+            self.set_status(f"Failed to copy result: {str(e)}", "#ff6b6b")
+    
+    def format_timestamp(self, timestamp_str: str) -> str:
+        """Format timestamp for display (Feature 5).
+        
+        Args:
+            timestamp_str: ISO format timestamp string
+            
+        Returns:
+            Formatted timestamp string like "Jan 15, 2024 at 10:30 AM"
+        """
+        return _format_timestamp(timestamp_str)
+    
+    def format_relative_time(self, timestamp_str: str) -> str:
+        """Format timestamp as relative time (Feature 5).
+
+        Args:
+            timestamp_str: ISO format timestamp string
+
+        Returns:
+            Relative time string like "2 minutes ago" or absolute for old scans
+        """
+        # The minute bucket makes cached entries expire once per minute,
+        # which is the coarsest unit the relative strings ever show
+        return _format_relative_time(timestamp_str, int(time.time() // 60))
+    
+    def _build_threat_details_widgets(self):
+        """Create the threat details widget tree on first use."""
+        self.threat_details_frame = tk.Frame(
+            self.result_card,
+            bg="#1a1a2e"
+        )
+
+        # Threat details text widget with scrollbar - more compact
+        details_scroll_frame = tk.Frame(self.threat_details_frame, bg="#1a1a2e")
+        details_scroll_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=8)
+
+        details_scrollbar = tk.Scrollbar(details_scroll_frame)
+        details_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.threat_details_text = tk.Text(
+            details_scroll_frame,
+            font=self._font_mono,
+            bg="#2d2d44",
+            fg="#ffffff",
+            relief=tk.FLAT,
+            wrap=tk.WORD,
+            height=8,
+            yscrollcommand=details_scrollbar.set,
+            state=tk.DISABLED
+        )
+        self.threat_details_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        details_scrollbar.config(command=self.threat_details_text.yview)
+
+    def _ensure_batch_ui(self):
+        """Create the batch-mode widgets on first use.
+
+        Follows the threat-details pattern: the input area, action
+        buttons, and results subtree only exist after the user first
+        switches to batch mode, keeping them off the startup path.
+        """
+        if self.batch_input_frame is not None:
+            return
+
+        # Batch input frame (Feature 6)
+        self.batch_input_frame = tk.Frame(self._input_card, bg="#1a1a2e")
+
+        batch_label = tk.Label(
+            self.batch_input_frame,
+            text="📋 Enter URLs (one per line):",
+            font=("Segoe UI", 11, "bold"),
+            bg="#1a1a2e",
+            fg="#00d4ff"
+        )
+        batch_label.pack(pady=(10, 5), padx=25, anchor=tk.W)
+
+        # Scrolled text for batch input
+        batch_text_frame = tk.Frame(self.batch_input_frame, bg="#1a1a2e")
+        batch_text_frame.pack(fill=tk.BOTH, expand=True, padx=25, pady=(0, 10))
+
+        self.batch_text = scrolledtext.ScrolledText(
+            batch_text_frame,
+            font=self._font_body,
+            bg="#2d2d44",
+            fg="#ffffff",
+            insertbackground="#00d4ff",
+            relief=tk.FLAT,
+            height=8,
+            wrap=tk.WORD
+        )
+        self.batch_text.pack(fill=tk.BOTH, expand=True)
+
+        # Batch analyze button (Feature 6)
+        self.batch_analyze_button = tk.Button(
+            self._button_frame,
+            text="📊  ANALYZE BATCH",
+            command=self.analyze_batch,
+            **self.PRIMARY_BUTTON_OPTS
+        )
+
+        # Cancel batch button (Feature 6)
+        self.cancel_batch_button = tk.Button(
+            self._button_frame,
+            text="⛔ CANCEL",
+            command=self.cancel_batch_processing,
+            font=("Segoe UI", 11, "bold"),
+            bg="#ff6b6b",
+            fg="#ffffff",
+            activebackground="#ff3366",
+            activeforeground="#ffffff",
+            cursor="hand2",
+            relief=tk.FLAT,
+            padx=25,
+            pady=10,
+            borderwidth=0
+        )
+
+        # Batch results frame (Feature 6)
+        self.batch_results_frame = tk.Frame(
+            self.result_card,
+            bg="#1a1a2e"
+        )
+
+        batch_results_label = tk.Label(
+            self.batch_results_frame,
+            text="📊 Batch Scan Results",
+            font=("Segoe UI", 14, "bold"),
+            bg="#1a1a2e",
+            fg="#00d4ff"
+        )
+        batch_results_label.pack(pady=(10, 5))
+
+        # Summary stats frame
+        self.batch_summary_frame = tk.Frame(
+            self.batch_results_frame,
+            bg="#2d2d44",
+            relief=tk.FLAT
+        )
+        self.batch_summary_frame.pack(fill=tk.X, padx=20, pady=10)
+
+        self.batch_summary_label = tk.Label(
+            self.batch_summary_frame,
+            text="",
+            font=self._font_medium,
+            bg="#2d2d44",
+            fg="#ffffff",
+            justify=tk.LEFT
+        )
+        self.batch_summary_label.pack(pady=10, padx=15)
+
+        # Progress label
+        self.batch_progress_label = tk.Label(
+            self.batch_results_frame,
+            text="",
+            font=("Segoe UI", 10, "italic"),
+            bg="#1a1a2e",
+            fg="#ffd700"
+        )
+        self.batch_progress_label.pack(pady=5)
+
+        # Batch results list with scrollbar
+        batch_scroll_frame = tk.Frame(self.batch_results_frame, bg="#1a1a2e")
+        batch_scroll_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+
+        batch_scrollbar = tk.Scrollbar(batch_scroll_frame)
+        batch_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.batch_results_listbox = tk.Listbox(
+            batch_scroll_frame,
+            font=self._font_mono,
+            bg="#2d2d44",
+            fg="#ffffff",
+            selectbackground="#00d4ff",
+            selectforeground="#0f2027",
+            relief=tk.FLAT,
+            height=10,
+            yscrollcommand=batch_scrollbar.set
+        )
+        self.batch_results_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        batch_scrollbar.config(command=self.batch_results_listbox.yview)
+
+        # Export batch button - more compact
+        self.export_batch_button = tk.Button(
+            self.batch_results_frame,
+            text="📤 Export Batch Results",
+            command=self.export_batch_results,
+            font=("Segoe UI", 10, "bold"),
+            bg="#00ff88",
+            fg="#0f2027",
+            activebackground="#00d4ff",
+            activeforeground="#0f2027",
+            cursor="hand2",
+            relief=tk.FLAT,
+            padx=25,
+            pady=8,
+            borderwidth=0
+        )
+        self.export_batch_button.pack(pady=10)
+
+    def _ensure_recent_urls_ui(self):
+        """Create the recent-URLs dropdown widgets on first open."""
+        if self.recent_urls_listbox_frame is not None:
+            return
+
+        self.recent_urls_listbox_frame = tk.Frame(
+            self._input_card,
+            bg="#2d2d44",
+            relief=tk.FLAT,
+            highlightthickness=1,
+            highlightbackground="#00d4ff"
+        )
+
+        recent_scroll = tk.Scrollbar(self.recent_urls_listbox_frame)
+        recent_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.recent_urls_listbox = tk.Listbox(
+            self.recent_urls_listbox_frame,
+            font=self._font_small,
+            bg="#2d2d44",
+            fg="#ffffff",
+            selectbackground="#00d4ff",
+            selectforeground="#1a1a2e",
+            relief=tk.FLAT,
+            height=6,
+            yscrollcommand=recent_scroll.set
+        )
+        self.recent_urls_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        recent_scroll.config(command=self.recent_urls_listbox.yview)
+
+        self.recent_urls_listbox.bind('<<ListboxSelect>>', self.on_recent_url_select)
+
+        # Clear history option in recent URLs
+        self.recent_urls_listbox.bind('<Button-3>', self.show_recent_urls_context_menu)
+
     def toggle_threat_details(self):
         """Toggle the visibility of threat details section (Feature 4)."""
         if self.threat_details_visible:
@@ -998,7 +1449,12 @@ Scanned: {timestamp}"""
             self.view_details_button.config(text="📋 View Details")
             self.threat_details_visible = False
         else:
-            # Show details
+            # Show details, building the widgets on the first open and
+            # rendering the text only if a new verdict arrived meanwhile
+            if self.threat_details_frame is None:
+                self._build_threat_details_widgets()
+            if self._details_dirty and self._details_verdict is not None:
+                self._render_threat_details(self._details_verdict)
             self.threat_details_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 8))
             self.view_details_button.config(text="📋 Hide Details")
             self.threat_details_visible = True
@@ -1010,195 +1466,191 @@ Scanned: {timestamp}"""
             self.result_canvas.yview_moveto(1.0)
     
     def display_threat_details(self, verdict):
-        """Display detailed threat information in tree structure (Feature 4).
-        
+        """Record the verdict for the threat details panel (Feature 4).
+
+        The multi-section details text is only rendered while the panel is
+        visible; otherwise it is marked dirty and built on the next toggle,
+        keeping the per-scan critical path free of the string assembly.
+
+        Args:
+            verdict: The FinalSecurityVerdict object with analysis details
+        """
+        self._details_verdict = verdict
+        self._details_dirty = True
+        if self.threat_details_visible:
+            self._render_threat_details(verdict)
+
+    def _render_threat_details(self, verdict):
+        """Build the details text and insert it into the Text widget.
+
         Args:
             verdict: The FinalSecurityVerdict object with analysis details
         """
         self.threat_details_text.config(state=tk.NORMAL)
-        self.threat_details_text.delete(1.0, tk.END)
-        
-        details_lines = []
-        details_lines.append("=" * 60)
-        details_lines.append("DETAILED THREAT ANALYSIS")
-        details_lines.append("=" * 60)
-        details_lines.append("")
-        
+
+        # Bind the verdict's optional attributes to locals once; the
+        # sections below only touch these
+        api_data = getattr(verdict, 'api_data', None)
+        score_data = getattr(verdict, 'rule_based_score', None)
+        reasons = getattr(verdict, 'reasons', None)
+
+        # Write into one buffer and hand Tk a single contiguous string
+        buf = io.StringIO()
+        write = buf.write
+        write(f"{_SEP_HEAVY}\nDETAILED THREAT ANALYSIS\n{_SEP_HEAVY}\n\n")
+
         # API Data Section
-        details_lines.append("🌐 API Analysis (Google Safe Browsing)")
-        details_lines.append("─" * 60)
-        
-        if hasattr(verdict, 'api_data') and verdict.api_data:
-            api_available = verdict.api_data.get('available', False)
-            details_lines.append(f"├─ API Status: {'Available ✓' if api_available else 'Unavailable ✗'}")
-            
-            threat_types = verdict.api_data.get('threat_types', [])
+        write(f"🌐 API Analysis (Google Safe Browsing)\n{_SEP_LIGHT}\n")
+
+        if api_data:
+            api_available = api_data.get('available', False)
+            write(f"├─ API Status: {'Available ✓' if api_available else 'Unavailable ✗'}\n")
+
+            threat_types = api_data.get('threat_types', [])
             if threat_types:
-                details_lines.append(f"├─ Threat Types Detected: {len(threat_types)}")
+                write(f"├─ Threat Types Detected: {len(threat_types)}\n")
                 for i, threat in enumerate(threat_types):
                     prefix = "├─" if i < len(threat_types) - 1 else "└─"
-                    details_lines.append(f"│  {prefix} {threat}")
+                    write(f"│  {prefix} {threat}\n")
             else:
-                details_lines.append("└─ No threats detected")
-            
+                write("└─ No threats detected\n")
+
             # Raw API matches if available
-            if 'raw_response' in verdict.api_data and verdict.api_data['raw_response']:
-                raw_resp = verdict.api_data['raw_response']
+            raw_resp = api_data.get('raw_response')
+            if raw_resp:
                 matches = raw_resp.get('matches', [])
                 if matches:
-                    details_lines.append("")
-                    details_lines.append("📊 Match Details:")
+                    write("\n📊 Match Details:\n")
                     for i, match in enumerate(matches):
-                        details_lines.append(f"│")
-                        details_lines.append(f"├─ Match #{i+1}")
-                        details_lines.append(f"│  ├─ Threat Type: {match.get('threatType', 'Unknown')}")
-                        details_lines.append(f"│  ├─ Platform: {match.get('platformType', 'Unknown')}")
-                        details_lines.append(f"│  ├─ Threat Entry: {match.get('threatEntryType', 'Unknown')}")
+                        write("│\n")
+                        write(f"├─ Match #{i+1}\n")
+                        write(f"│  ├─ Threat Type: {match.get('threatType', 'Unknown')}\n")
+                        write(f"│  ├─ Platform: {match.get('platformType', 'Unknown')}\n")
+                        write(f"│  ├─ Threat Entry: {match.get('threatEntryType', 'Unknown')}\n")
                         cache_duration = match.get('cacheDuration', 'Unknown')
-                        details_lines.append(f"│  └─ Cache Duration: {cache_duration}")
+                        write(f"│  └─ Cache Duration: {cache_duration}\n")
         else:
-            details_lines.append("└─ No API data available")
-        
-        details_lines.append("")
-        
+            write("└─ No API data available\n")
+
         # Rule-Based Analysis Section
-        details_lines.append("🤖 Rule-Based Analysis (AI-Powered)")
-        details_lines.append("─" * 60)
-        
-        if hasattr(verdict, 'rule_based_score') and verdict.rule_based_score:
-            score_data = verdict.rule_based_score
+        write(f"\n🤖 Rule-Based Analysis (AI-Powered)\n{_SEP_LIGHT}\n")
+
+        if score_data:
             total_score = score_data.get('total_score', 0)
-            details_lines.append(f"├─ Total Risk Score: {total_score}/100")
-            
+            write(f"├─ Total Risk Score: {total_score}/100\n")
+
             # Individual component scores
             if 'components' in score_data:
                 components = score_data['components']
-                details_lines.append("├─ Score Components:")
+                write("├─ Score Components:\n")
                 for key, value in components.items():
-                    details_lines.append(f"│  ├─ {key.replace('_', ' ').title()}: {value}")
-            
+                    write(f"│  ├─ {key.replace('_', ' ').title()}: {value}\n")
+
             # Risk factors
             if 'risk_factors' in score_data:
                 risk_factors = score_data['risk_factors']
                 if risk_factors:
-                    details_lines.append("├─ Risk Factors Detected:")
+                    write("├─ Risk Factors Detected:\n")
                     for i, factor in enumerate(risk_factors):
                         prefix = "└─" if i == len(risk_factors) - 1 else "├─"
-                        details_lines.append(f"│  {prefix} {factor}")
+                        write(f"│  {prefix} {factor}\n")
                 else:
-                    details_lines.append("└─ No significant risk factors")
+                    write("└─ No significant risk factors\n")
         else:
-            details_lines.append("└─ No rule-based analysis available")
-        
-        details_lines.append("")
-        
+            write("└─ No rule-based analysis available\n")
+
         # Final Verdict Section
-        details_lines.append("⚖️  Final Verdict")
-        details_lines.append("─" * 60)
-        details_lines.append(f"├─ Classification: {verdict.verdict.upper()}")
-        
-        if hasattr(verdict, 'reasons') and verdict.reasons:
-            details_lines.append("└─ Reasoning:")
-            for i, reason in enumerate(verdict.reasons):
-                prefix = "   └─" if i == len(verdict.reasons) - 1 else "   ├─"
-                details_lines.append(f"{prefix} {reason}")
-        
-        details_lines.append("")
-        details_lines.append("=" * 60)
-        
-        # Insert all lines
-        self.threat_details_text.insert(1.0, "\n".join(details_lines))
+        write(f"\n⚖️  Final Verdict\n{_SEP_LIGHT}\n")
+        write(f"├─ Classification: {verdict.verdict.upper()}\n")
+
+        if reasons:
+            write("└─ Reasoning:\n")
+            for i, reason in enumerate(reasons):
+                prefix = "   └─" if i == len(reasons) - 1 else "   ├─"
+                write(f"{prefix} {reason}\n")
+
+        write(f"\n{_SEP_HEAVY}")
+
+        # Swap the old text for the new in one Tcl call instead of a
+        # delete round trip followed by an insert
+        self.threat_details_text.replace(1.0, tk.END, buf.getvalue())
         self.threat_details_text.config(state=tk.DISABLED)
+        self._details_dirty = False
     
     
     def display_result(self, verdict):
         """Display the safety check result with modern styling and rule-based analysis."""
+        # Probe the verdict's optional attributes once up front; the
+        # branches below only use these locals
         status = verdict.verdict if hasattr(verdict, 'verdict') else verdict.status
-        rule_score = verdict.rule_based_score.get('total_score', 0) if hasattr(verdict, 'rule_based_score') else 0
-        
+        rule_score_dict = getattr(verdict, 'rule_based_score', None)
+        reasons = getattr(verdict, 'reasons', None)
+        api_data = getattr(verdict, 'api_data', None)
+        rule_score = rule_score_dict.get('total_score', 0) if rule_score_dict is not None else 0
+
         # Extract threat types for storage
-        threat_types = []
-        if hasattr(verdict, 'api_data') and 'threat_types' in verdict.api_data:
-            threat_types = verdict.api_data.get('threat_types', [])
-        elif hasattr(verdict, 'threat_types'):
-            threat_types = verdict.threat_types
-        
+        if api_data and 'threat_types' in api_data:
+            threat_types = api_data.get('threat_types', [])
+        else:
+            threat_types = getattr(verdict, 'threat_types', []) or []
+
         # Store current result for copying (Feature 5 - include timestamp)
         timestamp_str = datetime.now().strftime("%b %d, %Y at %I:%M %p")
         self.current_result = {
             'status': status,
             'threats': threat_types,
             'timestamp': timestamp_str,
-            'verdict': verdict  # Store full verdict for details view
+            # Export fields extracted eagerly so _perform_export reads
+            # plain keys instead of digging into the verdict
+            'rule_score': rule_score,
+            'reasons': list(reasons) if reasons else [],
+            # The full verdict stays for the details panel and
+            # ShareDialog, which render from api_data/reasons directly
+            'verdict': verdict
         }
         
-        if status == "safe":
-            self.result_icon.config(text="✅", fg="#00ff88")
-            self.result_label.config(
-                text="SAFE TO VISIT",
-                fg="#00ff88"
-            )
-            details = "✓ No threats detected\n✓ Verified by multiple security checks\n✓ This link appears to be legitimate and safe"
-            if hasattr(verdict, 'rule_based_score'):
-                details += f"\n📊 Risk Score: {rule_score}/100"
-            self.details_label.config(text=details, fg="#00ff88")
-            self.result_card.config(highlightbackground="#00ff88")
-            
-        elif status == "suspicious":
-            self.result_icon.config(text="⚠️", fg="#ffd700")
-            self.result_label.config(
-                text="POTENTIALLY SUSPICIOUS",
-                fg="#ffd700"
-            )
-            details_parts = []
-            if hasattr(verdict, 'reasons') and verdict.reasons:
-                details_parts.append(f"⚠ {verdict.reasons[0]}")
-            else:
-                if threat_types:
-                    details_parts.append(f"⚠ Detected: {', '.join(threat_types)}")
-            details_parts.append("⚠ Proceed with extreme caution")
-            details_parts.append("⚠ Consider avoiding this link")
-            if hasattr(verdict, 'rule_based_score'):
-                details_parts.append(f"📊 Risk Score: {rule_score}/100")
-            self.details_label.config(text="\n".join(details_parts), fg="#ffd700")
-            self.result_card.config(highlightbackground="#ffd700")
-            
-        elif status == "dangerous":
-            self.result_icon.config(text="🚫", fg="#ff3366")
-            self.result_label.config(
-                text="⚠️ DANGEROUS - DO NOT VISIT ⚠️",
-                fg="#ff3366"
-            )
+        style = self.STATUS_STYLE.get(status)
+        if style:
+            color = style["color"]
+            self._cfg(self.result_icon, text=style["icon"], fg=color)
+            self._cfg(self.result_label, text=style["label"], fg=color)
+
             details_parts = []
-            if hasattr(verdict, 'reasons') and verdict.reasons:
-                details_parts.append(f"🚨 {verdict.reasons[0]}")
-            else:
-                if threat_types:
-                    details_parts.append(f"🚨 Threats: {', '.join(threat_types)}")
-            details_parts.append("🚨 This site may harm your computer")
-            details_parts.append("🚨 DO NOT click or visit this link!")
-            if hasattr(verdict, 'rule_based_score'):
+            lead = style["lead"]
+            if lead:
+                if reasons:
+                    details_parts.append(f"{lead} {reasons[0]}")
+                elif threat_types:
+                    details_parts.append(
+                        f"{lead} {style['threat_label']}: {', '.join(threat_types)}")
+            details_parts.extend(style["static"])
+            if rule_score_dict is not None:
                 details_parts.append(f"📊 Risk Score: {rule_score}/100")
-            self.details_label.config(text="\n".join(details_parts), fg="#ff3366")
-            self.result_card.config(highlightbackground="#ff3366")
-        
-        # Show result action buttons in input area (under Copy URL and Clear buttons)
-        if hasattr(self, 'result_actions_row'):
-            self.result_actions_row.pack(fill=tk.X, padx=20, pady=(0, 12))
-        
-        # Feature 5: Display timestamp with relative time
-        timestamp_display = f"📅 Scanned: {timestamp_str}"
-        if hasattr(verdict, 'timestamp'):
-            relative_time = self.format_relative_time(verdict.timestamp)
-            timestamp_display += f" ({relative_time})"
-        self.timestamp_label.config(text=timestamp_display)
-        self.timestamp_label.pack(pady=(0, 8))
-        
-        # Feature 4: Populate threat details (after buttons so buttons stay visible)
-        self.display_threat_details(verdict)
-        
-        # Show view details button
-        self.view_details_button.pack(pady=(0, 8))
+
+            self._cfg(self.details_label,
+                      text=_wrap_details("\n".join(details_parts)), fg=color)
+            self._cfg(self.result_card, highlightbackground=color)
+        
+        if self._show_details_section:
+            # Feature 5: Display timestamp with relative time
+            timestamp_display = f"📅 Scanned: {timestamp_str}"
+            if hasattr(verdict, 'timestamp'):
+                relative_time = self.format_relative_time(verdict.timestamp)
+                timestamp_display += f" ({relative_time})"
+            self.timestamp_label.config(text=timestamp_display)
+
+            # Feature 4: Populate threat details (after buttons so buttons stay visible)
+            self.display_threat_details(verdict)
+
+        # Reveal the action row, timestamp and details button unless a
+        # previous result already left them packed
+        if not self._result_widgets_visible:
+            if hasattr(self, 'result_actions_row'):
+                self.result_actions_row.pack(fill=tk.X, padx=20, pady=(0, 12))
+            if self._show_details_section:
+                self.timestamp_label.pack(pady=(0, 8))
+                self.view_details_button.pack(pady=(0, 8))
+            self._result_widgets_visible = True
         
         # Update canvas scroll region to fit all content
         self.root.update_idletasks()
@@ -1213,64 +1665,96 @@ Scanned: {timestamp}"""
     
     def display_error(self, error_message):
         """Display error message with modern styling."""
-        self.result_icon.config(text="❌", fg="#ff6b6b")
-        self.result_label.config(
-            text="ERROR",
-            fg="#ff6b6b"
-        )
-        self.details_label.config(
-            text=error_message,
-            fg="#ff6b6b"
-        )
-        self.result_card.config(highlightbackground="#ff6b6b")
+        self._cfg(self.result_icon, text="❌", fg="#ff6b6b")
+        self._cfg(self.result_label, text="ERROR", fg="#ff6b6b")
+        self._cfg(self.details_label,
+                  text=_wrap_details(error_message), fg="#ff6b6b")
+        self._cfg(self.result_card, highlightbackground="#ff6b6b")
     
-    def analyze_url_thread(self, url):
+    def _finalize_success(self, verdict, status_text, status_color):
+        """Apply all post-scan UI updates in a single main-loop pass.
+
+        The sidebar is not refreshed here: the history write is still
+        queued at this point, and the writer thread schedules its own
+        refresh once the entry lands on disk.
+        """
+        self.display_result(verdict)
+        self.set_status(status_text, status_color)
+        self.enable_button()
+
+    def _finalize_error(self, error_msg, status_text):
+        """Apply all post-failure UI updates in a single main-loop pass."""
+        self.display_error(error_msg)
+        self.set_status(status_text, "#ff6b6b")
+        self.enable_button()
+
+    def _store_verdict(self, cache_key, verdict):
+        """Record a fresh verdict in the cache, evicting the LRU entry."""
+        self._verdict_cache[cache_key] = (time.time(), verdict)
+        self._verdict_cache.move_to_end(cache_key)
+        if len(self._verdict_cache) > self._verdict_cache_max:
+            self._verdict_cache.popitem(last=False)
+
+    def analyze_url_thread(self, url, cache_key=None):
         """Perform URL analysis in background thread."""
+        # Lazy import: keeps GUI startup off the requests/dotenv import cost
+        from src.url_analyzer import analyze_url_complete
         try:
-            # Perform complete analysis (API + rules)
-            self.root.after(0, lambda: self.set_status(f"Analyzing URL...", "#ffd700"))
+            # Perform complete analysis (API + rules). The "Initializing
+            # security scan..." status set by analyze_url stays up until
+            # the final one - no interstitial status redraw per scan
             verdict = analyze_url_complete(url)
-            
-            # Save to history
-            self.history.save_scan_to_history(url, verdict)
-            
-            # Update UI on main thread
-            self.root.after(0, lambda: self.display_result(verdict))
-            self.root.after(0, self.refresh_history)
-            status_colors = {"safe": "#00ff88", "suspicious": "#ffd700", "dangerous": "#ff3366"}
-            status_text = {"safe": "Verification complete - Safe", "suspicious": "Verification complete - Suspicious", "dangerous": "Verification complete - Dangerous"}
-            self.root.after(0, lambda: self.set_status(status_text[verdict.verdict], status_colors[verdict.verdict]))
-            
-        except APIKeyError as e:
-            error_msg = "⚠️ API Key Error\n\nPlease configure your Google Safe Browsing API key in the .env file.\nGet your free API key from Google Cloud Console."
-            self.root.after(0, lambda: self.display_error(error_msg))
-            self.root.after(0, lambda: self.set_status("API key not configured", "#ff6b6b"))
-            
-        except RateLimitError as e:
-            error_msg = "⏳ Rate Limit Exceeded\n\nToo many requests. Please wait a few minutes and try again."
-            self.root.after(0, lambda: self.display_error(error_msg))
-            self.root.after(0, lambda: self.set_status("Rate limit exceeded", "#ff6b6b"))
-            
-        except NetworkError as e:
-            error_msg = "🌐 Connection Error\n\nCannot reach Google Safe Browsing API.\nPlease check your internet connection and try again."
-            self.root.after(0, lambda: self.display_error(error_msg))
-            self.root.after(0, lambda: self.set_status("Network connection failed", "#ff6b6b"))
-            
-        except SafeBrowsingAPIError as e:
-            error_msg = "⚠️ Service Error\n\nUnable to complete the security check.\nPlease try again in a few moments."
-            self.root.after(0, lambda: self.display_error(error_msg))
-            self.root.after(0, lambda: self.set_status("API request failed", "#ff6b6b"))
-            
+
+            # Cache for instant re-display of repeat scans
+            if cache_key is None:
+                cache_key = self._verdict_cache_key(url)
+            self._store_verdict(cache_key, verdict)
+
+            # Warm the relative-time cache off-thread: display_result's
+            # main-thread call for this timestamp then resolves as a
+            # pure lru_cache hit instead of parsing during paint
+            self.format_relative_time(verdict.timestamp)
+
+            # Queue the history write; the writer thread persists it off
+            # the scan's critical path
+            self._history_queue.put((url, verdict))
+
+            # Finalize everything (result, history, status, button) in one
+            # scheduled callback: the main loop wakes once and paints once.
+            # Resolve the status text/color from the class tables here,
+            # outside the scheduled call
+            status = verdict.verdict
+            self.root.after_idle(self._finalize_success, verdict,
+                                 self.STATUS_TEXT[status],
+                                 self.STATUS_COLORS[status])
+
         except Exception as e:
-            error_msg = f"⚠️ Unexpected Error\n\n{str(e)}\n\nPlease try again or contact support if the issue persists."
-            self.root.after(0, lambda: self.display_error(error_msg))
-            self.root.after(0, lambda: self.set_status("Unexpected error occurred", "#ff6b6b"))
-        
-        finally:
-            self.root.after(0, self.enable_button)
+            # Walk the MRO so subclasses (e.g. RateLimitError) match their
+            # own entry before the SafeBrowsingAPIError base
+            for cls in type(e).__mro__:
+                entry = _get_error_table().get(cls)
+                if entry:
+                    error_msg, status_text = entry
+                    break
+            else:
+                error_msg = _ERR_UNEXPECTED.format(e)
+                status_text = _STATUS_UNEXPECTED
+            self.root.after_idle(self._finalize_error, error_msg, status_text)
     
+    def _on_return_key(self, event):
+        """Dispatch Return-key scans via after_idle so key repeats coalesce."""
+        self.root.after_idle(self.analyze_url)
+        return "break"
+
     def analyze_url(self):
         """Handle analyze button click."""
+        # Admission control: ignore re-entry while a scan is running and
+        # debounce triggers arriving within 300 ms of the previous one
+        now = time.monotonic()
+        if self._scan_in_flight or now - self._last_click_monotonic < 0.3:
+            return
+        self._last_click_monotonic = now
+
         # Validate input
         if not self.validate_input():
             return
@@ -1281,21 +1765,51 @@ Scanned: {timestamp}"""
         # Feature 8: Auto-format URL
         url = self.validator.format_url(url)
         self.url_var.set(url)
-        
+
+        # One structural parse up front: bail out on input with no usable
+        # host before paying for clear/cache/worker dispatch. format_url
+        # always prepends a scheme, so a non-participating scheme group
+        # means the remainder could not be split into scheme://host
+        parsed = _URL_RE.match(url)
+        if parsed is None or not parsed.group('scheme'):
+            # Error renders on a cleared card like every other failure
+            # path: hide the previous scan's action row and drop its
+            # current_result so Copy/Export can't pick up a stale verdict
+            self.clear_results()
+            self.display_error("⚠️ Invalid URL\n\nThe URL could not be parsed.\nPlease check it and try again.")
+            self.set_status("Invalid URL format", "#ff6b6b")
+            return
+
         # Clear previous results
         self.clear_results()
+
+        # Re-display a fresh cached verdict instead of re-running the scan.
+        # The key is computed once here and handed to the worker, so the
+        # URL isn't re-normalized (re-split) on the scan thread
+        cache_key = self._verdict_cache_key(url)
+        cached = self._verdict_cache.get(cache_key)
+        if cached:
+            if time.time() - cached[0] < self.VERDICT_CACHE_TTL:
+                self._verdict_cache.move_to_end(cache_key)
+                self.display_result(cached[1])
+                self.set_status("Verification complete (cached result)", "#00d4ff")
+                return
+            # Expired: drop it now rather than letting it hold an LRU
+            # slot until eviction
+            del self._verdict_cache[cache_key]
         
         # Disable button during processing
+        self._scan_in_flight = True
         self.disable_button()
         self.set_status("Initializing security scan...", "#ffd700")
-        
-        # Run analysis in background thread to prevent UI freezing
-        thread = threading.Thread(target=self.analyze_url_thread, args=(url,), daemon=True)
-        thread.start()
+
+        # Run analysis on the persistent worker pool to prevent UI freezing
+        self._executor.submit(self.analyze_url_thread, url, cache_key)
     
     # Feature 6: Batch mode methods
     def toggle_batch_mode(self):
         """Toggle between single and batch mode."""
+        self._ensure_batch_ui()
         self.batch_mode = not self.batch_mode
         
         if self.batch_mode:
@@ -1303,7 +1817,8 @@ Scanned: {timestamp}"""
             self.mode_toggle_button.config(text="🔗 Single Mode", bg="#ffd700")
             self.url_entry.pack_forget()
             self.recent_urls_button.place_forget()
-            self.recent_urls_listbox_frame.pack_forget()
+            if self.recent_urls_listbox_frame is not None:
+                self.recent_urls_listbox_frame.pack_forget()
             self.validation_indicator.pack_forget()
             self.batch_input_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
             self.analyze_button.pack_forget()
@@ -1330,9 +1845,11 @@ Scanned: {timestamp}"""
             messagebox.showwarning("Input Required", "Please enter URLs to analyze (one per line).")
             return
         
-        # Parse URLs
-        urls = [line.strip() for line in text_content.split('\n') if line.strip()]
-        
+        # Parse URLs, dropping duplicate lines (order-preserving) so a
+        # pasted list with repeats scans each URL once
+        urls = list(OrderedDict.fromkeys(
+            line.strip() for line in text_content.split('\n') if line.strip()))
+
         if not urls:
             messagebox.showwarning("Input Required", "No valid URLs found.")
             return
@@ -1343,9 +1860,9 @@ Scanned: {timestamp}"""
         self.batch_results_listbox.delete(0, tk.END)
         
         # Show batch results frame
-        self.result_icon.config(text="")
-        self.result_label.config(text="")
-        self.details_label.config(text="")
+        self._cfg(self.result_icon, text="")
+        self._cfg(self.result_label, text="")
+        self._cfg(self.details_label, text="")
         self.batch_results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
         # Update canvas scroll region
@@ -1358,40 +1875,93 @@ Scanned: {timestamp}"""
         self.cancel_batch_button.pack(side=tk.LEFT, padx=5)
         self.mode_toggle_button.config(state=tk.DISABLED)
         self.batch_processing = True
-        
-        # Start batch processing in background
-        thread = threading.Thread(target=self.process_batch_urls, args=(urls,), daemon=True)
-        thread.start()
-    
+
+        # Start batch processing on the persistent worker pool; one
+        # recurring drain timer applies its queued UI updates in ticks
+        self._executor.submit(self.process_batch_urls, urls)
+        self.root.after(50, self._drain_ui_queue)
+
+    def _set_batch_progress(self, text):
+        """Update the batch progress label (runs on the UI thread)."""
+        self.batch_progress_label.config(text=text)
+
+    def _drain_ui_queue(self):
+        """Apply all queued batch UI events in one timer tick.
+
+        A single recurring 50 ms timer amortizes the Tcl event cost over
+        every update queued since the last tick, instead of one after()
+        callback per row. Reschedules itself only while the batch is
+        still running, so the timer costs nothing outside batch mode.
+        """
+        try:
+            while True:
+                try:
+                    func, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                func(*args)
+        finally:
+            # Reschedule even if one queued update raised; with separate
+            # after() callbacks the remaining events would still have run,
+            # and the drain loop must not be weaker than that
+            if self.batch_processing or not self._ui_queue.empty():
+                self.root.after(50, self._drain_ui_queue)
+
     def process_batch_urls(self, urls):
-        """Process multiple URLs sequentially."""
+        """Process multiple URLs with batched API requests."""
+        from src.url_analyzer import analyze_urls_batch
+
         total = len(urls)
-        
-        for i, url in enumerate(urls, 1):
-            if self.cancel_batch:
-                self.root.after(0, lambda: self.set_status("Batch processing cancelled", "#ff6b6b"))
-                break
-            
-            # Update progress
-            progress_text = f"Processing {i}/{total}..."
-            self.root.after(0, lambda t=progress_text: self.batch_progress_label.config(text=t))
-            self.root.after(0, lambda: self.set_status(f"Analyzing URL {i}/{total}...", "#ffd700"))
-            
+        formatted_urls = [self.validator.format_url(url) for url in urls]
+
+        # One batched check: the API layer packs up to 500 URLs per
+        # request, so the whole list costs a handful of round trips
+        # instead of one per URL
+        self._ui_queue.put((self._set_batch_progress, (f"Checking {total} URLs...",)))
+        self._ui_queue.put((self.set_status, (f"Analyzing {total} URLs...", "#ffd700")))
+
+        # Serve URLs with a fresh cached verdict without an API trip and
+        # batch only the misses; different raw lines can format to the
+        # same URL, so the miss list is deduped on the formatted form
+        now = time.time()
+        verdict_by_url = {}
+        for formatted_url in OrderedDict.fromkeys(formatted_urls):
+            entry = self._verdict_cache.get(self._verdict_cache_key(formatted_url))
+            if entry and now - entry[0] < self.VERDICT_CACHE_TTL:
+                verdict_by_url[formatted_url] = entry[1]
+        cached_urls = set(verdict_by_url)
+        to_scan = [u for u in OrderedDict.fromkeys(formatted_urls)
+                   if u not in cached_urls]
+
+        verdicts = None
+        if not self.cancel_batch:
             try:
-                # Format URL
-                formatted_url = self.validator.format_url(url)
-                
-                # Analyze URL
-                verdict = analyze_url_complete(formatted_url)
-                
+                if to_scan:
+                    for scan_url, verdict in zip(to_scan, analyze_urls_batch(to_scan)):
+                        verdict_by_url[scan_url] = verdict
+                        self._store_verdict(self._verdict_cache_key(scan_url), verdict)
+                verdicts = [verdict_by_url[u] for u in formatted_urls]
+            except Exception as e:
+                batch_error = str(e)
+
+        # Collect display lines and insert them with one variadic call at
+        # the end; post-processing is local work, so per-row progress and
+        # per-row inserts would only add Tcl traffic
+        lines = []
+        icons_get = self.STATUS_ICONS.get
+        if verdicts is not None:
+            for formatted_url, verdict in zip(formatted_urls, verdicts):
+                if self.cancel_batch:
+                    break
+
                 # Extract data
                 status = verdict.verdict if hasattr(verdict, 'verdict') else verdict.status
                 threat_types = []
                 if hasattr(verdict, 'api_data') and 'threat_types' in verdict.api_data:
                     threat_types = verdict.api_data.get('threat_types', [])
-                
+
                 rule_score = verdict.rule_based_score.get('total_score', 0) if hasattr(verdict, 'rule_based_score') else 0
-                
+
                 # Store result
                 result = {
                     'url': formatted_url,
@@ -1402,47 +1972,56 @@ Scanned: {timestamp}"""
                     'reasons': verdict.reasons if hasattr(verdict, 'reasons') else []
                 }
                 self.batch_results.append(result)
-                
-                # Save to history
-                self.history.save_scan_to_history(formatted_url, verdict)
-                
-                # Display in listbox
-                status_icons = {"safe": "✅", "suspicious": "⚠️", "dangerous": "🚫"}
-                icon = status_icons.get(status, "❓")
-                display_text = f"{icon} {status.upper()}: {formatted_url[:60]}"
-                self.root.after(0, lambda dt=display_text: self.batch_results_listbox.insert(tk.END, dt))
-                
-            except Exception as e:
+
+                # Queue the history write for the batching writer thread.
+                # Cache hits were persisted when first scanned, matching
+                # the single-URL cached path
+                if formatted_url not in cached_urls:
+                    self._history_queue.put((formatted_url, verdict))
+
+                # Display in listbox; %.60s truncates without the slice
+                # copy an explicit [:60] would allocate
+                lines.append("%s %s: %.60s" % (
+                    icons_get(status, "❓"), status.upper(), formatted_url))
+        elif not self.cancel_batch:
+            # The batch failed as a whole; record one error row per URL
+            for url in urls:
                 error_result = {
                     'url': url,
                     'status': 'error',
                     'threat_types': [],
                     'rule_score': 0,
                     'timestamp': datetime.now().isoformat(),
-                    'reasons': [f"Error: {str(e)}"]
+                    'reasons': [f"Error: {batch_error}"]
                 }
                 self.batch_results.append(error_result)
-                error_text = f"❌ ERROR: {url[:60]}"
-                self.root.after(0, lambda et=error_text: self.batch_results_listbox.insert(tk.END, et))
-        
-        # Update summary
-        self.root.after(0, self.update_batch_summary)
-        self.root.after(0, self.finish_batch_processing)
+                lines.append("❌ ERROR: %.60s" % url)
+
+        if lines:
+            self._ui_queue.put((self.batch_results_listbox.insert, (tk.END, *lines)))
+
+        if self.cancel_batch:
+            self._ui_queue.put((self.set_status, ("Batch processing cancelled", "#ff6b6b")))
+
+        # Update summary. These run after every queued row event; the
+        # finish handler clears batch_processing, which lets the drain
+        # timer stop rescheduling
+        self._ui_queue.put((self.update_batch_summary, ()))
+        self._ui_queue.put((self.finish_batch_processing, ()))
     
     def update_batch_summary(self):
         """Update batch summary statistics."""
+        # One pass over the results instead of one generator scan per
+        # status; Counter's tallying loop runs in C
         total = len(self.batch_results)
-        safe = sum(1 for r in self.batch_results if r['status'] == 'safe')
-        suspicious = sum(1 for r in self.batch_results if r['status'] == 'suspicious')
-        dangerous = sum(1 for r in self.batch_results if r['status'] == 'dangerous')
-        errors = sum(1 for r in self.batch_results if r['status'] == 'error')
+        counts = Counter(r['status'] for r in self.batch_results)
 
         summary_text = f"""Total URLs: {total}
-✅ Safe: {safe}
-⚠️ Suspicious: {suspicious}
-🚫 Dangerous: {dangerous}"""
-        if errors > 0:
-            summary_text += f"\n❌ Errors: {errors}"
+✅ Safe: {counts['safe']}
+⚠️ Suspicious: {counts['suspicious']}
+🚫 Dangerous: {counts['dangerous']}"""
+        if counts['error']:
+            summary_text += f"\n❌ Errors: {counts['error']}"
 
         self.batch_summary_label.config(text=summary_text)
         self.batch_progress_label.config(text="✓ Batch processing complete!", fg="#00ff88")
@@ -1460,6 +2039,9 @@ Scanned: {timestamp}"""
         self.cancel_batch_button.pack_forget()
         self.batch_analyze_button.pack(side=tk.LEFT, padx=5)
         self.mode_toggle_button.config(state=tk.NORMAL)
+        # Catch the sidebar up on the refreshes deferred during the
+        # batch; the epoch gate makes this free when nothing landed yet
+        self.refresh_history()
     
     def cancel_batch_processing(self):
         """Cancel ongoing batch processing."""
@@ -1472,81 +2054,91 @@ Scanned: {timestamp}"""
         if not self.current_result:
             messagebox.showwarning("No Result", "No scan result available to export.")
             return
-        
-        # Ask for export format
-        format_window = tk.Toplevel(self.root)
-        format_window.title("Select Export Format")
-        format_window.geometry("300x200")
-        format_window.resizable(False, False)
-        format_window.configure(bg="#1a1a2e")
-        format_window.transient(self.root)
-        format_window.grab_set()
-        
-        tk.Label(
-            format_window,
-            text="Select Export Format:",
-            font=("Segoe UI", 12, "bold"),
-            bg="#1a1a2e",
-            fg="#ffffff"
-        ).pack(pady=20)
-        
-        def export_as(fmt):
-            format_window.destroy()
-            self._perform_export(fmt)
-        
-        btn_frame = tk.Frame(format_window, bg="#1a1a2e")
-        btn_frame.pack(expand=True)
-        
-        for fmt, label in [('json', '📄 JSON'), ('csv', '📊 CSV'), ('txt', '📝 TXT')]:
-            tk.Button(
-                btn_frame,
-                text=label,
-                command=lambda f=fmt: export_as(f),
-                font=("Segoe UI", 11),
-                bg="#00d4ff",
-                fg="#0f2027",
-                cursor="hand2",
-                relief=tk.FLAT,
-                padx=30,
-                pady=10,
-                width=12
-            ).pack(pady=5)
-    
+
+        self._ask_export_format(self._perform_export)
+
+    def _ask_export_format(self, on_select):
+        """Show the shared export-format chooser dialog.
+
+        One Toplevel serves both single and batch export: it is built on
+        first use, then hidden and re-shown instead of destroyed and
+        rebuilt for every export.
+
+        Args:
+            on_select: Called with the chosen format ('json', 'csv', 'txt')
+        """
+        if self._fmt_dialog is None:
+            dialog = tk.Toplevel(self.root)
+            dialog.withdraw()
+            dialog.title("Select Export Format")
+            dialog.geometry("300x200")
+            dialog.resizable(False, False)
+            dialog.configure(bg="#1a1a2e")
+            dialog.transient(self.root)
+            dialog.protocol("WM_DELETE_WINDOW", self._dismiss_format_dialog)
+
+            tk.Label(
+                dialog,
+                text="Select Export Format:",
+                font=self._font_bold,
+                bg="#1a1a2e",
+                fg="#ffffff"
+            ).pack(pady=20)
+
+            btn_frame = tk.Frame(dialog, bg="#1a1a2e")
+            btn_frame.pack(expand=True)
+
+            for fmt, label in [('json', '📄 JSON'), ('csv', '📊 CSV'), ('txt', '📝 TXT')]:
+                tk.Button(
+                    btn_frame,
+                    text=label,
+                    command=lambda f=fmt: self._choose_export_format(f),
+                    **self.POPUP_BUTTON_OPTS
+                ).pack(pady=5)
+
+            self._fmt_dialog = dialog
+
+        self._fmt_on_select = on_select
+        self._fmt_dialog.deiconify()
+        self._fmt_dialog.grab_set()
+
+    def _choose_export_format(self, fmt):
+        """Handle a format button press in the chooser dialog."""
+        self._dismiss_format_dialog()
+        self._fmt_on_select(fmt)
+
+    def _dismiss_format_dialog(self):
+        """Hide the format chooser, keeping it around for reuse."""
+        self._fmt_dialog.grab_release()
+        self._fmt_dialog.withdraw()
+
     def _perform_export(self, format_type):
         """Perform the actual export operation."""
-        # File dialog
-        extensions = {
-            'json': [("JSON files", "*.json")],
-            'csv': [("CSV files", "*.csv")],
-            'txt': [("Text files", "*.txt")]
-        }
-        
+        # Lazy import: exports are rare, so csv/json stay off the startup path
+        from src.gui_export import ExportManager
+
         filepath = filedialog.asksaveasfilename(
             defaultextension=f".{format_type}",
-            filetypes=extensions.get(format_type, [("All files", "*.*")])
+            filetypes=_EXPORT_FILETYPES.get(format_type, [("All files", "*.*")])
         )
-        
+
         if not filepath:
             return
-        
-        # Prepare export data
+
+        # Prepare export data from the fields display_result extracted
         export_data = {
             'url': self.url_var.get().strip(),
             'status': self.current_result['status'],
             'threat_types': self.current_result['threats'],
             'timestamp': self.current_result['timestamp'],
-            'rule_score': self.current_result.get('verdict').rule_based_score.get('total_score', 0) if hasattr(self.current_result.get('verdict'), 'rule_based_score') else 0,
-            'reasons': self.current_result.get('verdict').reasons if hasattr(self.current_result.get('verdict'), 'reasons') else []
+            'rule_score': self.current_result.get('rule_score', 0),
+            'reasons': self.current_result.get('reasons', [])
         }
-        
-        # Export
-        success = False
-        if format_type == 'json':
-            success = ExportManager.export_to_json(filepath, export_data)
-        elif format_type == 'csv':
-            success = ExportManager.export_to_csv(filepath, export_data)
-        elif format_type == 'txt':
-            success = ExportManager.export_to_txt(filepath, export_data)
+
+        # Dispatch by method name; a new format only needs its
+        # ExportManager method, not another branch here
+        exporter = getattr(ExportManager, f"export_to_{format_type}", None)
+        success = exporter(filepath, export_data) if exporter else False
         
         if success:
             self.set_status(f"✓ Exported to {format_type.upper()}", "#00ff88")
@@ -1569,7 +2161,8 @@ Scanned: {timestamp}"""
             messagebox.showerror("Error", "No verdict data available to share.")
             return
         
-        # Show share dialog
+        # Show share dialog (imported on first use; most sessions never share)
+        from src.gui_share import ShareDialog
         share_dialog = ShareDialog(self.root, url, verdict)
         share_dialog.show()
     
@@ -1578,59 +2171,18 @@ Scanned: {timestamp}"""
         if not self.batch_results:
             messagebox.showwarning("No Results", "No batch results available to export.")
             return
-        
-        # Ask for export format
-        format_window = tk.Toplevel(self.root)
-        format_window.title("Select Export Format")
-        format_window.geometry("300x200")
-        format_window.resizable(False, False)
-        format_window.configure(bg="#1a1a2e")
-        format_window.transient(self.root)
-        format_window.grab_set()
-        
-        tk.Label(
-            format_window,
-            text="Select Export Format:",
-            font=("Segoe UI", 12, "bold"),
-            bg="#1a1a2e",
-            fg="#ffffff"
-        ).pack(pady=20)
-        
-        def export_as(fmt):
-            format_window.destroy()
-            self._perform_batch_export(fmt)
-        
-        btn_frame = tk.Frame(format_window, bg="#1a1a2e")
-        btn_frame.pack(expand=True)
-        
-        for fmt, label in [('json', '📄 JSON'), ('csv', '📊 CSV'), ('txt', '📝 TXT')]:
-            tk.Button(
-                btn_frame,
-                text=label,
-                command=lambda f=fmt: export_as(f),
-                font=("Segoe UI", 11),
-                bg="#00d4ff",
-                fg="#0f2027",
-                cursor="hand2",
-                relief=tk.FLAT,
-                padx=30,
-                pady=10,
-                width=12
-            ).pack(pady=5)
+
+        self._ask_export_format(self._perform_batch_export)
     
     def _perform_batch_export(self, format_type):
         """Perform batch export operation."""
-        extensions = {
-            'json': [("JSON files", "*.json")],
-            'csv': [("CSV files", "*.csv")],
-            'txt': [("Text files", "*.txt")]
-        }
-        
+        from src.gui_export import ExportManager
+
         filepath = filedialog.asksaveasfilename(
             defaultextension=f".{format_type}",
-            filetypes=extensions.get(format_type, [("All files", "*.*")])
+            filetypes=_EXPORT_FILETYPES.get(format_type, [("All files", "*.*")])
         )
-        
+
         if not filepath:
             return
         
@@ -1645,43 +2197,56 @@ Scanned: {timestamp}"""
     
     # Feature 8: URL validation methods
     def on_url_change(self, *args):
-        """Handle URL input changes for real-time validation."""
+        """Debounce URL input changes; validation runs after typing pauses.
+
+        Each keystroke just reschedules the pending validation, so a
+        burst of typing costs one validator pass 250 ms after the last
+        key instead of a regex-and-parse run per character.
+        """
+        if self._validation_after_id is not None:
+            self.root.after_cancel(self._validation_after_id)
+        self._validation_after_id = self.root.after(250, self._run_validation)
+
+    def _run_validation(self):
+        """Validate the current URL and update the inline indicator."""
+        self._validation_after_id = None
         url = self.url_var.get().strip()
-        
+
         if not url or self.batch_mode:
-            self.validation_indicator.config(text="")
+            self._cfg(self.validation_indicator, text="")
             return
-        
-        # Validate URL
-        self.validation_result = self.validator.validate_url(url)
-        
+
+        # Validate URL (memoized per string)
+        self.validation_result = self._validate_cached(url)
+
         if self.validation_result.is_valid:
             if self.validation_result.warnings:
                 # Valid but has warnings
                 warning_text = f"⚠️ Warning: {self.validation_result.warnings[0]}"
-                self.validation_indicator.config(text=warning_text, fg="#ffd700")
+                self._cfg(self.validation_indicator, text=warning_text, fg="#ffd700")
             else:
                 # Completely valid
-                self.validation_indicator.config(text="✓ Valid URL", fg="#00ff88")
+                self._cfg(self.validation_indicator, text="✓ Valid URL", fg="#00ff88")
         else:
             # Invalid URL
             if self.validation_result.errors:
                 error_text = f"✗ {self.validation_result.errors[0]}"
-                self.validation_indicator.config(text=error_text, fg="#ff6b6b")
-            
+                self._cfg(self.validation_indicator, text=error_text, fg="#ff6b6b")
+
             # Show suggestions if available
             if self.validation_result.suggestions and len(url) > 3:
                 suggestion_text = f"💡 {self.validation_result.suggestions[0]}"
-                self.validation_indicator.config(text=suggestion_text, fg="#00d4ff")
+                self._cfg(self.validation_indicator, text=suggestion_text, fg="#00d4ff")
     
     # Feature 9: Recent URLs dropdown methods
     def load_recent_urls(self):
         """Load recent URLs from history."""
-        recent_scans = self.history.get_recent_scans(15)
+        recent_scans = self._get_recent_scans(15)
         self.recent_urls = [scan['url'] for scan in recent_scans]
     
     def toggle_recent_urls_dropdown(self):
         """Toggle recent URLs dropdown visibility."""
+        self._ensure_recent_urls_ui()
         if self.recent_urls_dropdown_visible:
             self.recent_urls_listbox_frame.pack_forget()
             self.recent_urls_button.config(text="▼")
@@ -1690,12 +2255,12 @@ Scanned: {timestamp}"""
             # Refresh recent URLs
             self.load_recent_urls()
             
-            # Populate listbox
+            # Populate listbox with one variadic insert (one Tcl call)
             self.recent_urls_listbox.delete(0, tk.END)
             if self.recent_urls:
-                for url in self.recent_urls:
-                    display_url = url if len(url) <= 50 else url[:47] + "..."
-                    self.recent_urls_listbox.insert(tk.END, display_url)
+                self.recent_urls_listbox.insert(tk.END, *(
+                    url if len(url) <= 50 else url[:47] + "..."
+                    for url in self.recent_urls))
             else:
                 self.recent_urls_listbox.insert(tk.END, "(No recent URLs)")
             
@@ -1733,10 +2298,32 @@ Scanned: {timestamp}"""
             self.set_status("History cleared", "#00ff88")
 
 
+def _warm_startup():
+    """Pay one-time startup costs in the background, off the UI thread.
+
+    The regexes are compiled at import, but the first match still pays
+    one-time costs (urllib's split caches, internal regex setup), and the
+    first API call would otherwise pay DNS plus the TLS handshake. Doing
+    both here while the user reads the window moves those hitches off the
+    first real click.
+    """
+    _URL_RE.match("https://example.com/")
+    URLValidator.validate_url("https://example.com/")
+    normalize_url("https://example.com/")
+    # Imported here so requests/dotenv also load on this thread rather
+    # than during GUI startup
+    from src.api_client import warm_connection
+    warm_connection()
+
+
 def main():
     """Launch the GUI application."""
+    import logging
+    logging.basicConfig(level=logging.WARNING)
     root = tk.Tk()
     app = LinkSafetyCheckerGUI(root)
+    threading.Thread(target=_warm_startup, name="lsc-warmup",
+                     daemon=True).start()
     root.mainloop()
 
 
@@ -17,6 +17,13 @@ class ScanHistory:
         """
         self.history_file = Path(history_file)
         self.max_scans = max_scans
+        # Bumped on every successful write; lets callers cache reads and
+        # only go back to disk after the history actually changed
+        self.epoch = 0
+        # In-memory copy of the scans list and the epoch it reflects, so
+        # reads after our own writes skip the JSON re-parse entirely
+        self._scans_cache = None
+        self._cache_epoch = -1
         self._ensure_history_file()
     
     def _ensure_history_file(self):
@@ -35,56 +42,87 @@ class ScanHistory:
             except Exception as e:
                 print(f"Error creating history file: {e}")
     
+    @staticmethod
+    def _build_scan_entry(url: str, verdict: Any) -> Dict[str, Any]:
+        """Build the stored history entry for one scan result.
+
+        Args:
+            url: The URL that was scanned
+            verdict: The verdict object from the analysis
+
+        Returns:
+            Dictionary ready to insert into the scans list
+        """
+        # Extract status and threat types from verdict
+        status = verdict.verdict if hasattr(verdict, 'verdict') else verdict.status
+        threat_types = []
+        if hasattr(verdict, 'api_data') and 'threat_types' in verdict.api_data:
+            threat_types = verdict.api_data.get('threat_types', [])
+        elif hasattr(verdict, 'threat_types'):
+            threat_types = verdict.threat_types
+
+        # Create scan entry (timestamp is also pre-formatted here so the
+        # GUI history list doesn't re-parse ISO strings on every refresh)
+        now = datetime.now()
+        return {
+            "url": url,
+            "status": status,
+            "threat_types": threat_types,
+            "timestamp": now.isoformat(),
+            "formatted_short": now.strftime("%m/%d %H:%M"),
+            "result": {
+                "verdict": status,
+                "threat_types": threat_types,
+                "rule_score": verdict.rule_based_score.get('total_score', 0) if hasattr(verdict, 'rule_based_score') else 0
+            }
+        }
+
     def save_scan_to_history(self, url: str, verdict: Any) -> bool:
         """Save a scan result to history.
-        
+
         Args:
             url: The URL that was scanned
             verdict: The verdict object from the analysis
-            
+
+        Returns:
+            True if save was successful, False otherwise
+        """
+        return self.save_scans_batch([(url, verdict)])
+
+    def save_scans_batch(self, items: List[tuple]) -> bool:
+        """Save several scan results with one file read and one write.
+
+        Args:
+            items: List of (url, verdict) pairs in scan order
+
         Returns:
             True if save was successful, False otherwise
         """
+        if not items:
+            return True
         try:
             # Load existing history
             history_data = self._load_history_data()
-            
-            # Extract status and threat types from verdict
-            status = verdict.verdict if hasattr(verdict, 'verdict') else verdict.status
-            threat_types = []
-            if hasattr(verdict, 'api_data') and 'threat_types' in verdict.api_data:
-                threat_types = verdict.api_data.get('threat_types', [])
-            elif hasattr(verdict, 'threat_types'):
-                threat_types = verdict.threat_types
-            
-            # Create scan entry
-            scan_entry = {
-                "url": url,
-                "status": status,
-                "threat_types": threat_types,
-                "timestamp": datetime.now().isoformat(),
-                "result": {
-                    "verdict": status,
-                    "threat_types": threat_types,
-                    "rule_score": verdict.rule_based_score.get('total_score', 0) if hasattr(verdict, 'rule_based_score') else 0
-                }
-            }
-            
-            # Add to history
-            history_data["scans"].insert(0, scan_entry)  # Insert at beginning
-            
+
+            # Newest scans go first, so insert in reverse scan order
+            for url, verdict in reversed(items):
+                history_data["scans"].insert(0, self._build_scan_entry(url, verdict))
+
             # Enforce max scans limit
             if len(history_data["scans"]) > self.max_scans:
                 history_data["scans"] = history_data["scans"][:self.max_scans]
-            
+
             # Save back to file
             with open(self.history_file, 'w', encoding='utf-8') as f:
                 json.dump(history_data, f, indent=2)
-            
+
+            self.epoch += 1
+            self._scans_cache = history_data["scans"]
+            self._cache_epoch = self.epoch
             return True
-            
+
         except Exception as e:
-            print(f"Error saving scan to history: {e}")
+            print(f"Error saving scans to history: {e}")
             return False
     
     def _load_history_data(self) -> Dict[str, Any]:
@@ -119,8 +157,12 @@ class ScanHistory:
         Returns:
             List of scan entries
         """
+        if self._cache_epoch == self.epoch and self._scans_cache is not None:
+            return self._scans_cache
         data = self._load_history_data()
-        return data.get("scans", [])
+        self._scans_cache = data.get("scans", [])
+        self._cache_epoch = self.epoch
+        return self._scans_cache
     
     def get_recent_scans(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get the most recent N scans.
@@ -150,6 +192,9 @@ class ScanHistory:
             }
             with open(self.history_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
+            self.epoch += 1
+            self._scans_cache = data["scans"]
+            self._cache_epoch = self.epoch
             return True
         except Exception as e:
             print(f"Error clearing history: {e}")
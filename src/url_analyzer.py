@@ -1,8 +1,13 @@
 """Main integration module for complete URL analysis."""
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
-from src.api_client import check_url_safety, SafeBrowsingAPIError
+from src.api_client import check_url_safety, check_urls_safety, SafeBrowsingAPIError
+from src.config import MAX_PER_DOMAIN, INTRA_DOMAIN_DELAY
 from src.response_parser import parse_safe_browsing_response
 from src.risk_scorer import calculate_rule_score
 from src.score_combiner import combine_scores
@@ -26,26 +31,37 @@ def analyze_url_complete(url: str) -> FinalSecurityVerdict:
         FinalSecurityVerdict object with comprehensive analysis
     """
     api_result = None
-    api_available = True
-    
+
     try:
         api_response = check_url_safety(url)
         api_result = parse_safe_browsing_response(api_response, url)
     except SafeBrowsingAPIError as e:
-        api_available = False
         api_result = None
-    
+
+    return _finish_verdict(url, api_result)
+
+
+def _finish_verdict(url: str, api_result) -> FinalSecurityVerdict:
+    """Run rule scoring and score combination for one URL.
+
+    Args:
+        url: The URL being analyzed
+        api_result: Parsed API result, or None when unavailable
+
+    Returns:
+        FinalSecurityVerdict object for the URL
+    """
     rule_score = calculate_rule_score(url)
-    
+
     verdict_dict = combine_scores(
         api_result=api_result,
         rule_score=rule_score,
         url=url
     )
-    
+
     if not verdict_dict.get("timestamp"):
         verdict_dict["timestamp"] = datetime.now(timezone.utc).isoformat()
-    
+
     return FinalSecurityVerdict(
         url=verdict_dict["url"],
         verdict=verdict_dict["verdict"],
@@ -54,3 +70,105 @@ def analyze_url_complete(url: str) -> FinalSecurityVerdict:
         reasons=verdict_dict["reasons"],
         timestamp=verdict_dict["timestamp"]
     )
+
+
+def analyze_urls_batch(urls: List[str]) -> List[FinalSecurityVerdict]:
+    """
+    Analyze multiple URLs using batched Safe Browsing API requests.
+
+    All URLs go to the API together (check_urls_safety packs up to 500
+    per threatMatches:find call), then rule scoring and score
+    combination run locally per URL. Compared with calling
+    analyze_url_complete in a loop, N HTTP round trips become
+    ceil(N/500).
+
+    Args:
+        urls: List of URLs to analyze
+
+    Returns:
+        List of FinalSecurityVerdict objects in input order
+    """
+    if not urls:
+        return []
+
+    try:
+        api_responses = check_urls_safety(urls)
+    except SafeBrowsingAPIError:
+        api_responses = None
+
+    verdicts = []
+    for url in urls:
+        api_result = None
+        if api_responses is not None:
+            response = api_responses.get(url, {})
+            # Uncheckable URLs fall through to rules-only analysis, the
+            # same degradation the single-URL path applies
+            if not response.get("invalid_url"):
+                api_result = parse_safe_browsing_response(response, url)
+        verdicts.append(_finish_verdict(url, api_result))
+    return verdicts
+
+
+def _registrable_domain(url: str) -> str:
+    """Approximate the registrable domain of a URL's host.
+
+    Takes the last two host labels (e.g. 'sub.example.com' -> 'example.com');
+    good enough to bucket same-site URLs without a public-suffix dependency.
+
+    Args:
+        url: The URL to bucket
+
+    Returns:
+        Registrable-domain string (empty if the URL has no host)
+    """
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+    labels = host.split('.')
+    return '.'.join(labels[-2:]) if len(labels) >= 2 else host
+
+
+def _analyze_throttled(url: str, domain_slot: threading.Semaphore) -> FinalSecurityVerdict:
+    """Analyze one URL while holding its domain's concurrency slot."""
+    with domain_slot:
+        verdict = analyze_url_complete(url)
+        if INTRA_DOMAIN_DELAY > 0:
+            time.sleep(INTRA_DOMAIN_DELAY)
+        return verdict
+
+
+def analyze_urls_concurrent(urls: List[str], max_workers: int = 20,
+                            submit_delay: float = 0.0) -> List[FinalSecurityVerdict]:
+    """
+    Analyze multiple URLs concurrently with a bounded worker pool.
+
+    URL checks are latency-bound network work, so overlapping them gives
+    near-linear speedup up to the pool size. Workers share the pooled
+    HTTPS session in api_client, reusing connections across checks. At
+    most MAX_PER_DOMAIN checks of the same registrable domain run at
+    once, with a short delay between them, to avoid tripping per-domain
+    throttling.
+
+    Args:
+        urls: List of URLs to analyze
+        max_workers: Maximum number of concurrent checks
+        submit_delay: Optional pause (seconds) between submissions, to
+            stay under the API's per-second quota
+
+    Returns:
+        List of FinalSecurityVerdict objects in input order
+    """
+    if not urls:
+        return []
+
+    domain_slots = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for url in urls:
+            slot = domain_slots.setdefault(
+                _registrable_domain(url), threading.Semaphore(MAX_PER_DOMAIN))
+            futures.append(executor.submit(_analyze_throttled, url, slot))
+            if submit_delay > 0:
+                time.sleep(submit_delay)
+        return [future.result() for future in futures]
@@ -1,8 +1,17 @@
 """URL validation and formatting module for Link Safety Checker."""
 import re
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import urlparse, urlunparse, urlsplit, urlunsplit
 from typing import Dict, List, Any
 
+# Import-time singletons: compiling per call would churn re's bounded
+# internal cache on hot validation paths
+# Characters never valid in a URL: ASCII whitespace and control chars
+# plus the RFC 3986 "unwise" set. Expressed as a str.translate deletion
+# table so the check is a single C-level pass with no regex engine
+_INVALID_CHARS_TABLE = str.maketrans(
+    '', '', ''.join(map(chr, range(0x21))) + '\x7f<>{}|\\^`"')
+_IPV4_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+
 
 class URLValidationResult:
     """Result object for URL validation."""
@@ -190,8 +199,7 @@ class URLValidator:
         host = hostname.split(':')[0]
         
         # Check for IPv4
-        ipv4_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        if re.match(ipv4_pattern, host):
+        if _IPV4_RE.match(host):
             # Validate that each octet is 0-255
             parts = host.split('.')
             try:
@@ -291,9 +299,9 @@ def validate_url(url: str) -> Dict[str, Any]:
     if not parsed.netloc:
         errors.append("Missing domain (host).")
     
-    # Check for invalid characters (whitespace, control chars)
-    invalid_chars_pattern = re.compile(r'[\s<>{}|\\^`"]')
-    if invalid_chars_pattern.search(url):
+    # Check for invalid characters (whitespace, control chars): if the
+    # deletion table removed anything, the URL contained one
+    if len(url.translate(_INVALID_CHARS_TABLE)) != len(url):
         errors.append("URL contains invalid characters (whitespace or control chars).")
     
     # Check for multiple '//' segments (suspicious pattern)
@@ -327,6 +335,73 @@ def validate_url(url: str) -> Dict[str, Any]:
     }
 
 
+def _remove_dot_segments(path: str) -> str:
+    """Resolve '.' and '..' segments in a URL path, and nothing else.
+
+    Unlike posixpath.normpath, this keeps a trailing slash and interior
+    empty segments ('//'): '/path/' and '/path', or '/a//b' and '/a/b',
+    are distinct resources and must not fold to one cache key or be
+    rewritten in the URL actually sent to the API.
+
+    Args:
+        path: URL path component
+
+    Returns:
+        Path with dot segments resolved
+    """
+    segments = path.split('/')
+    if '.' not in segments and '..' not in segments:
+        return path
+
+    resolved: List[str] = []
+    for segment in segments:
+        if segment == '.':
+            continue
+        if segment == '..':
+            # Never pop the leading '' that anchors an absolute path
+            if len(resolved) > 1:
+                resolved.pop()
+            continue
+        resolved.append(segment)
+
+    # A final '.' or '..' names a directory; keep the slash it implies
+    if segments[-1] in ('.', '..') and (not resolved or resolved[-1] != ''):
+        resolved.append('')
+    return '/'.join(resolved)
+
+
+def normalize_url(url: str) -> str:
+    """Canonicalize a URL so equivalent spellings compare (and cache) equal.
+
+    Lowercases the scheme and host, strips default ports, resolves '.'
+    and '..' path segments, and drops the fragment. Query strings are
+    preserved since they can change what a URL serves.
+
+    Args:
+        url: URL string to canonicalize
+
+    Returns:
+        Canonical URL string (input returned unchanged if unparseable)
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if scheme == 'http' and netloc.endswith(':80'):
+        netloc = netloc[:-3]
+    elif scheme == 'https' and netloc.endswith(':443'):
+        netloc = netloc[:-4]
+
+    path = parts.path
+    if path:
+        path = _remove_dot_segments(path)
+
+    return urlunsplit((scheme, netloc, path, parts.query, ''))
+
+
 def extract_domain(url: str) -> str:
     """Extract domain from URL (backward compatibility).
     
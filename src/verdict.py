@@ -1,5 +1,6 @@
 """Final security verdict object for URL analysis."""
 import json
+import sys
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
@@ -13,7 +14,12 @@ class FinalSecurityVerdict:
     - Rule-based risk scoring
     - Combined analysis and reasoning
     """
-    
+
+    # Fixed attribute set: drops the per-instance __dict__, which matters
+    # when batch runs create one verdict per URL
+    __slots__ = ("url", "verdict", "api_data", "rule_based_score",
+                 "reasons", "timestamp")
+
     def __init__(
         self,
         url: str,
@@ -35,7 +41,9 @@ class FinalSecurityVerdict:
             timestamp: ISO timestamp (generated if not provided)
         """
         self.url = url
-        self.verdict = verdict
+        # Interned so the status dict lookups downstream (colors, icons,
+        # labels) hash and compare by pointer
+        self.verdict = sys.intern(verdict)
         self.api_data = api_data
         self.rule_based_score = rule_based_score
         self.reasons = reasons
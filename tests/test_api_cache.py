@@ -0,0 +1,35 @@
+"""Unit tests for the persistent verdict cache."""
+from src.api_cache import PersistentVerdictCache
+
+
+def test_set_then_get_roundtrip(tmp_path):
+    cache = PersistentVerdictCache(db_path=str(tmp_path / "cache.db"))
+    cache.set("https://example.com", {"matches": []}, ttl=300)
+    assert cache.get("https://example.com") == {"matches": []}
+    cache.close()
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = PersistentVerdictCache(db_path=str(tmp_path / "cache.db"))
+    cache.set("https://example.com", {"matches": []}, ttl=-1)
+    assert cache.get("https://example.com") is None
+    cache.close()
+
+
+def test_survives_reopen(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = PersistentVerdictCache(db_path=db_path)
+    cache.set("https://example.com", {"matches": []}, ttl=300)
+    cache.close()
+
+    reopened = PersistentVerdictCache(db_path=db_path)
+    assert reopened.get("https://example.com") == {"matches": []}
+    reopened.close()
+
+
+def test_clear_removes_entries(tmp_path):
+    cache = PersistentVerdictCache(db_path=str(tmp_path / "cache.db"))
+    cache.set("https://example.com", {"matches": []}, ttl=300)
+    cache.clear()
+    assert cache.get("https://example.com") is None
+    cache.close()
@@ -1,26 +1,48 @@
 """Unit tests for API client with mocked responses."""
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch, Mock
 import requests
+from src import api_client
+from src.api_cache import PersistentVerdictCache
 from src.api_client import (
     check_url_safety,
+    check_urls_safety,
+    clear_cache,
     SafeBrowsingAPIError,
     APIKeyError,
     RateLimitError,
-    NetworkError
+    NetworkError,
+    InvalidURLError
 )
 
 
+# Mocked responses below only configure .json(), so force the stdlib
+# parse path; the orjson path reads raw bytes from response.content
+@patch('src.api_client.ORJSON_AVAILABLE', False)
 class TestSafeBrowsingAPIClient(unittest.TestCase):
     """Test cases for Safe Browsing API client."""
-    
+
     def setUp(self):
         """Set up test fixtures."""
         self.test_url = "https://example.com"
         self.api_key = "test_api_key_12345"
+        # Point the disk cache at a throwaway database: tests must never
+        # read, write or clear the developer's real ~/.lsc_cache.db
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        test_cache = PersistentVerdictCache(
+            db_path=str(Path(tmp_dir.name) / "cache.db"))
+        self.addCleanup(test_cache.close)
+        cache_patcher = patch.object(api_client, '_persistent_cache', test_cache)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        clear_cache()
+        api_client._bucket.reset()
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_successful_request_with_no_threats(self, mock_post):
         """Test successful API request with no threats detected (safe URL)."""
         mock_response = Mock()
@@ -34,7 +56,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         mock_post.assert_called_once()
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_successful_request_with_malware_threat(self, mock_post):
         """Test successful API request with MALWARE threat detected."""
         mock_response = Mock()
@@ -59,7 +81,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertEqual(result["matches"][0]["threatType"], "MALWARE")
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_successful_request_with_phishing_threat(self, mock_post):
         """Test successful API request with SOCIAL_ENGINEERING (phishing) threat."""
         mock_response = Mock()
@@ -83,7 +105,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertEqual(result["matches"][0]["threatType"], "SOCIAL_ENGINEERING")
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_successful_request_with_multiple_threats(self, mock_post):
         """Test successful API request with multiple threat types."""
         mock_response = Mock()
@@ -121,7 +143,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertIn("not configured", str(context.exception))
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_invalid_api_key_400_error(self, mock_post):
         """Test error handling for HTTP 400 (invalid API key)."""
         mock_response = Mock()
@@ -135,7 +157,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertIn("Invalid API key", str(context.exception))
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_forbidden_403_error(self, mock_post):
         """Test error handling for HTTP 403 (forbidden/API key restrictions)."""
         mock_response = Mock()
@@ -149,7 +171,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertIn("restrictions", str(context.exception))
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_rate_limit_429_error(self, mock_post):
         """Test error handling for HTTP 429 (rate limit exceeded)."""
         mock_response = Mock()
@@ -165,7 +187,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertIn("60", str(context.exception))
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_timeout_error(self, mock_post):
         """Test error handling for request timeout."""
         mock_post.side_effect = requests.exceptions.Timeout()
@@ -176,7 +198,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertIn("timeout", str(context.exception).lower())
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_connection_error(self, mock_post):
         """Test error handling for network connection error."""
         mock_post.side_effect = requests.exceptions.ConnectionError("Failed to connect")
@@ -187,7 +209,7 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertIn("Failed to connect", str(context.exception))
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
     def test_json_parsing_error(self, mock_post):
         """Test error handling for malformed JSON response."""
         mock_response = Mock()
@@ -201,7 +223,110 @@ class TestSafeBrowsingAPIClient(unittest.TestCase):
         self.assertIn("parse", str(context.exception).lower())
     
     @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
-    @patch('src.api_client.requests.post')
+    @patch('src.api_client._session.post')
+    def test_batch_request_demultiplexes_matches(self, mock_post):
+        """Test batch check maps matches back to the right input URLs."""
+        bad_url = "http://malware.example.com"
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "matches": [
+                {
+                    "threatType": "MALWARE",
+                    "platformType": "ANY_PLATFORM",
+                    "threat": {"url": bad_url},
+                    "cacheDuration": "300s",
+                    "threatEntryType": "URL"
+                }
+            ]
+        }
+        mock_post.return_value = mock_response
+
+        results = check_urls_safety([self.test_url, bad_url])
+
+        mock_post.assert_called_once()
+        self.assertEqual(results[self.test_url], {})
+        self.assertEqual(len(results[bad_url]["matches"]), 1)
+        self.assertEqual(results[bad_url]["matches"][0]["threatType"], "MALWARE")
+
+    @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
+    @patch('src.api_client._session.post')
+    def test_batch_request_sends_all_urls_in_one_call(self, mock_post):
+        """Test batch check packs all URLs into a single request body."""
+        urls = [f"https://example{i}.com" for i in range(5)]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        mock_post.return_value = mock_response
+
+        results = check_urls_safety(urls)
+
+        mock_post.assert_called_once()
+        request_body = mock_post.call_args.kwargs.get('json') or mock_post.call_args.args[1]
+        entries = request_body["threatInfo"]["threatEntries"]
+        self.assertEqual([e["url"] for e in entries], urls)
+        self.assertEqual(results, {url: {} for url in urls})
+
+    @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
+    @patch('src.api_client._session.post')
+    def test_invalid_url_rejected_without_network_call(self, mock_post):
+        """Test malformed URLs are rejected locally, never hitting the API."""
+        with self.assertRaises(InvalidURLError):
+            check_url_safety("not a url")
+
+        mock_post.assert_not_called()
+
+    @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
+    @patch('src.api_client._session.post')
+    def test_batch_flags_invalid_urls_and_checks_the_rest(self, mock_post):
+        """Test a batch with an invalid URL still checks the valid ones."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        mock_post.return_value = mock_response
+
+        results = check_urls_safety([self.test_url, "ftp://example.com"])
+
+        mock_post.assert_called_once()
+        self.assertEqual(results[self.test_url], {})
+        self.assertTrue(results["ftp://example.com"]["invalid_url"])
+
+    @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
+    @patch('src.api_client._session.post')
+    def test_repeated_check_served_from_cache(self, mock_post):
+        """Test a repeated check of the same URL skips the network call."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        mock_post.return_value = mock_response
+
+        first = check_url_safety(self.test_url)
+        second = check_url_safety(self.test_url)
+
+        self.assertEqual(first, second)
+        mock_post.assert_called_once()
+
+    @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
+    @patch('src.api_client._session.post')
+    def test_failed_check_is_not_cached(self, mock_post):
+        """Test errors are not cached, so the next check retries the API."""
+        error_response = Mock()
+        error_response.status_code = 500
+        error_response.text = "Internal server error"
+        ok_response = Mock()
+        ok_response.status_code = 200
+        ok_response.json.return_value = {}
+        mock_post.side_effect = [error_response, ok_response]
+
+        with self.assertRaises(SafeBrowsingAPIError):
+            check_url_safety(self.test_url)
+        result = check_url_safety(self.test_url)
+
+        self.assertEqual(result, {})
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('src.api_client.GOOGLE_SAFE_BROWSING_API_KEY', 'test_api_key')
+    @patch('src.api_client._session.post')
     def test_unexpected_status_code(self, mock_post):
         """Test error handling for unexpected HTTP status codes."""
         mock_response = Mock()
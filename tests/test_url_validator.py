@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.url_validator import is_valid_url, validate_url, extract_domain
+from src.url_validator import is_valid_url, validate_url, extract_domain, normalize_url
 
 
 @pytest.mark.parametrize(
@@ -64,4 +64,30 @@ def test_extract_domain_with_port() -> None:
 
 def test_extract_domain_invalid_raises() -> None:
     with pytest.raises(ValueError):
-        extract_domain("example.com")  # şemasız -> hata
\ No newline at end of file
+        extract_domain("example.com")  # şemasız -> hata
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://Example.COM/path", "https://example.com/path"),
+        ("HTTPS://example.com", "https://example.com"),
+        ("http://example.com:80/path", "http://example.com/path"),
+        ("https://example.com:443/", "https://example.com/"),
+        ("https://example.com/page#fragment", "https://example.com/page"),
+        ("https://example.com/a/./b/../c", "https://example.com/a/c"),
+        ("https://example.com/path?q=1", "https://example.com/path?q=1"),
+        # Trailing slashes and interior '//' name distinct resources
+        # and must survive normalization
+        ("https://example.com/path/", "https://example.com/path/"),
+        ("https://example.com/a//b", "https://example.com/a//b"),
+        ("https://example.com/a/b/.", "https://example.com/a/b/"),
+        ("https://example.com/a/b/..", "https://example.com/a/"),
+    ],
+)
+def test_normalize_url(url: str, expected: str) -> None:
+    assert normalize_url(url) == expected
+
+
+def test_normalize_url_equivalent_spellings_match() -> None:
+    assert normalize_url("https://Example.com:443/a/../b#x") == normalize_url("https://example.com/b")
\ No newline at end of file